@@ -0,0 +1,123 @@
+"""Évaluation du graphe de données sur des colonnes NumPy.
+
+Les colonnes alimentent des entrées non câblées (celles qui utiliseraient
+sinon leur valeur ``in_default:``). Les noeuds ``vectorized`` traitent une
+colonne entière par appel de ``process_batch`` ; les autres sont appelés
+ligne par ligne. Les noeuds qui ne dépendent d'aucune colonne sont évalués
+une seule fois, comme lors d'un ``run``.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except Exception:
+    np = None
+    HAVE_NUMPY = False
+
+
+def evaluate_batch(engine, columns: Dict[Tuple[str, str], Any], targets: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Évalue les noeuds purs de ``engine`` pour chaque ligne de ``columns``.
+
+    ``columns`` associe ``(node_id, entrée)`` à une séquence de valeurs,
+    toutes de même longueur. Retourne ``{node_id: {port: valeur}}`` pour
+    ``targets`` (par défaut tous les noeuds influencés par une colonne) ;
+    une valeur est un ``ndarray`` si elle dépend d'une colonne, un scalaire
+    sinon. Les noeuds d'exécution ne sont pas exécutés : leurs sorties sont
+    les dernières enregistrées.
+    """
+    if not HAVE_NUMPY:
+        raise RuntimeError("numpy manquant : evaluate_batch indisponible.")
+    if engine._dirty or not engine._plans:
+        # jamais exécuté, ou graphe remplacé par ``reset`` : plan à (re)construire
+        if engine._dirty:
+            engine.results = {}
+        engine._reclassify()
+        engine._compile()
+    plans = engine._plans
+    nodes = engine._slot_nodes
+
+    fed: Dict[Tuple[int, str], Any] = {}
+    rows = None
+    for (nid, in_name), col in columns.items():
+        slot = engine._slots.get(nid)
+        if slot is None:
+            raise ValueError(f"Noeud inconnu : {nid}")
+        plan = plans[slot]
+        if plan.is_exec:
+            raise ValueError(f"{nid} n'est pas un noeud pur")
+        binding = next((b for b in plan.bindings if b.name == in_name), None)
+        if binding is None:
+            raise ValueError(f"{nid} n'a pas d'entrée {in_name!r}")
+        # ``origin`` : câble vers une constante repliée en littéral à la compilation
+        if binding.src >= 0 or binding.origin >= 0:
+            raise ValueError(f"{nid}.{in_name} est câblée")
+        col = np.asarray(col)
+        if rows is None:
+            rows = len(col)
+        elif len(col) != rows:
+            raise ValueError(f"Colonne {nid}.{in_name} : {len(col)} lignes au lieu de {rows}")
+        fed[(slot, in_name)] = col
+
+    # noeuds influencés par une colonne : les noeuds alimentés et leur aval pur
+    tainted = set()
+    stack = [slot for slot, _ in fed]
+    while stack:
+        slot = stack.pop()
+        if slot not in tainted:
+            tainted.add(slot)
+            stack.extend(engine._data_succ[slot])
+
+    if targets is not None:
+        # on se limite à l'amont des cibles
+        needed = set()
+        stack = [engine._slots[nid] for nid in targets]
+        while stack:
+            slot = stack.pop()
+            if slot in needed or slot not in tainted:
+                continue
+            needed.add(slot)
+            stack.extend(b.src if b.src >= 0 else b.origin
+                         for b in plans[slot].bindings if b.src >= 0 or b.origin >= 0)
+        tainted = needed
+
+    cache: Dict[int, Dict[str, Any]] = {}
+    values: Dict[int, Dict[str, Any]] = {}
+    for slot in engine._pure_order:
+        if slot not in tainted:
+            continue
+        kwargs = {}
+        for b in plans[slot].bindings:
+            src = b.src if b.src >= 0 else b.origin
+            if src in values:
+                kwargs[b.name] = values[src].get(b.port, None)
+            elif b.src >= 0:
+                kwargs[b.name] = engine._eval_node(b.src, cache).get(b.port, None)
+            else:
+                kwargs[b.name] = fed.get((slot, b.name), b.default)
+        values[slot] = _process_columns(nodes[slot], kwargs, rows)
+
+    if targets is None:
+        return {plans[slot].id: out for slot, out in values.items()}
+    out = {}
+    for nid in targets:
+        slot = engine._slots[nid]
+        out[nid] = values[slot] if slot in values else engine._eval_node(slot, cache)
+    return out
+
+
+def _process_columns(node, kwargs: Dict[str, Any], rows: int) -> Dict[str, Any]:
+    """Applique un noeud à des entrées mêlant colonnes et scalaires."""
+    if getattr(node, 'vectorized', False):
+        return node.process_batch(**kwargs) or {}
+    cols = {k: v for k, v in kwargs.items() if isinstance(v, np.ndarray)}
+    if not cols:
+        return node.process(**kwargs) or {}
+    # repli ligne par ligne
+    series: Dict[str, list] = {}
+    row = dict(kwargs)
+    for i in range(rows):
+        for k, v in cols.items():
+            row[k] = v[i].item() if hasattr(v[i], 'item') else v[i]
+        for port, val in (node.process(**row) or {}).items():
+            series.setdefault(port, []).append(val)
+    return {port: np.asarray(vals) for port, vals in series.items()}
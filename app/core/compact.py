@@ -0,0 +1,112 @@
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Any
+
+# typecode des tableaux d'indices (entiers signés 32 bits)
+_INDEX = "i"
+
+
+def _csr(n: int, keys: List[int], columns: Tuple[List[int], ...]) -> Tuple[array, Tuple[array, ...]]:
+    """Regroupe des arêtes par clé en tableaux CSR.
+
+    Retourne ``ptr`` (``n + 1`` entrées) et les colonnes permutées : les
+    arêtes de la clé ``k`` occupent ``ptr[k]:ptr[k + 1]``, dans leur ordre
+    d'origine (le tri est stable).
+    """
+    counts = [0] * (n + 1)
+    for k in keys:
+        counts[k + 1] += 1
+    ptr = array(_INDEX, accumulate(counts))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return ptr, tuple(array(_INDEX, map(col.__getitem__, order)) for col in columns)
+
+
+class GraphIndex:
+    """Graphe interné : noeuds et ports numérotés, adjacences CSR.
+
+    Le noeud ``i`` est ``ids[i]`` (ordre des specs) ; les noms de ports sont
+    internés dans ``ports``. Les arêtes de données sont groupées par
+    destination (``data_*``), celles d'exécution par source (``exec_*``),
+    dans des ``array`` d'entiers : quelques octets par arête au lieu d'un
+    tuple de chaînes par clé de dictionnaire. Les arêtes dont une extrémité
+    est inconnue sont ignorées.
+    """
+    __slots__ = ("ids", "index", "type_names", "params", "ports", "port_index",
+                 "data_ptr", "data_src", "data_src_port", "data_dst_port",
+                 "exec_ptr", "exec_src_port", "exec_dst", "exec_dst_port")
+
+    def __init__(self, nodes: Iterable[Any], edges: Iterable[Any]):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.type_names: List[str] = []
+        self.params: List[Dict[str, Any]] = []
+        for spec in nodes:
+            slot = self.index.get(spec.id)
+            if slot is None:
+                self.index[spec.id] = len(self.ids)
+                self.ids.append(spec.id); self.type_names.append(spec.type_name); self.params.append(spec.params)
+            else:
+                # même sémantique que ``{n.id: n for n in nodes}`` : la dernière spec l'emporte
+                self.type_names[slot] = spec.type_name; self.params[slot] = spec.params
+        self.ports: List[str] = []
+        self.port_index: Dict[str, int] = {}
+
+        index, port_index = self.index, self.port_index
+
+        def port(name: str) -> int:
+            pid = port_index.get(name)
+            return pid if pid is not None else self.port(name)
+
+        d_dst, d_src, d_sp, d_dp = [], [], [], []
+        x_src, x_sp, x_dst, x_dp = [], [], [], []
+        for e in edges:
+            src = index.get(e.src_id)
+            dst = index.get(e.dst_id)
+            if src is None or dst is None:
+                continue
+            if e.kind == "data":
+                d_dst.append(dst); d_src.append(src); d_sp.append(port(e.src_port)); d_dp.append(port(e.dst_port))
+            else:
+                x_src.append(src); x_sp.append(port(e.src_port)); x_dst.append(dst); x_dp.append(port(e.dst_port))
+        n = len(self.ids)
+        self.data_ptr, (self.data_src, self.data_src_port, self.data_dst_port) = _csr(n, d_dst, (d_src, d_sp, d_dp))
+        self.exec_ptr, (self.exec_src_port, self.exec_dst, self.exec_dst_port) = _csr(n, x_src, (x_sp, x_dst, x_dp))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def port(self, name: str) -> int:
+        """Identifiant entier du port ``name`` (interné au premier usage)."""
+        pid = self.port_index.get(name)
+        if pid is None:
+            pid = self.port_index[name] = len(self.ports)
+            self.ports.append(name)
+        return pid
+
+    def incoming(self, slot: int) -> Iterator[Tuple[int, int, int]]:
+        """Arêtes de données entrantes : ``(port destination, source, port source)``."""
+        for e in range(self.data_ptr[slot], self.data_ptr[slot + 1]):
+            yield self.data_dst_port[e], self.data_src[e], self.data_src_port[e]
+
+    def outgoing(self, slot: int) -> Iterator[Tuple[int, int, int]]:
+        """Arêtes d'exécution sortantes : ``(port source, cible, port cible)``."""
+        for e in range(self.exec_ptr[slot], self.exec_ptr[slot + 1]):
+            yield self.exec_src_port[e], self.exec_dst[e], self.exec_dst_port[e]
+
+
+class SlotMapping(Mapping):
+    """Vue ``id -> valeur`` en lecture seule sur une liste indexée par slot."""
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: List[Any]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, nid: str) -> Any:
+        return self._values[self._index[nid]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
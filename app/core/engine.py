@@ -1,18 +1,33 @@
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import marshal
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Tuple, DefaultDict, Optional
+from typing import Dict, List, Any, Tuple, DefaultDict, Optional, Union, Mapping, Iterable, FrozenSet
 from collections import defaultdict
+from concurrent.futures import Executor
 from .registry import registry
-from typing import Optional
+from .scheduler import Scheduler, make_scheduler
+from .timers import TimerQueue
+from .profiler import EngineProfiler, KIND_EXEC, KIND_PROCESS
+from .compact import GraphIndex, SlotMapping
 
 DEFAULT_PREFIX = "in_default:"
+DEFAULT_MAX_STEPS = 10000
+DEFAULT_MAX_ITERATIONS = 1000000
+RETENTION_MODES = ("all", "live")
+# specs et plans sans __dict__ (Python >= 3.10) : compte pour les grands graphes
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+@dataclass(**_SLOTS)
 class NodeSpec:
     id: str
     type_name: str
     params: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class EdgeSpec:
     kind: str         # "data" ou "exec"
     src_id: str
@@ -20,148 +35,1115 @@ class EdgeSpec:
     dst_id: str
     dst_port: str
 
+@dataclass(frozen=True, **_SLOTS)
+class InputBinding:
+    """Entrée de données précompilée : source câblée ou valeur par défaut.
+
+    ``src`` est le slot entier du noeud source (-1 si l'entrée n'est pas
+    câblée, auquel cas ``default`` est utilisé). Pour un littéral issu du
+    repliement de constantes, ``origin`` garde le slot replié et ``port``
+    son port.
+    """
+    name: str
+    src: int = -1
+    port: Optional[str] = None
+    default: Any = None
+    origin: int = -1
+
+    def __reduce__(self):
+        # pickle (``PlanCache``) : appel direct du constructeur, bien plus
+        # rapide que l'état par défaut d'une dataclass figée à slots
+        return InputBinding, (self.name, self.src, self.port, self.default, self.origin)
+
+@dataclass(frozen=True, **_SLOTS)
+class NodePlan:
+    """Table figée produite par ``_compile`` pour un noeud."""
+    slot: int
+    id: str
+    is_exec: bool
+    bindings: Tuple[InputBinding, ...]
+    exec_out: Dict[str, Tuple[Tuple[int, str], ...]]
+
+    def __reduce__(self):
+        return NodePlan, (self.slot, self.id, self.is_exec, self.bindings, self.exec_out)
+
+@dataclass(frozen=True, **_SLOTS)
+class CompiledGraph:
+    """Produit de la compilation, indépendant de l'état d'un run.
+
+    Rien n'y est modifié après ``_compile`` : plusieurs moteurs peuvent
+    partager la même instance (sous-graphes, réutilisation entre runs).
+    ``folded`` associe aux slots repliés leurs sorties constantes.
+    """
+    graph: GraphIndex
+    is_exec: List[bool]
+    plans: List[NodePlan]
+    data_succ: List[Tuple[int, ...]]
+    var_readers: Dict[str, List[int]]
+    volatile: List[bool]
+    pure_order: List[int]
+    folded: Dict[int, Dict[str, Any]]
+
+# ``exec_out`` partagé par tous les noeuds purs (jamais modifié)
+_NO_EXEC_OUT: Dict[str, Tuple[Tuple[int, str], ...]] = {}
+
+# étapes restantes avant ``max_steps`` : le run en a une, chaque itération
+# d'un corps de boucle une autre (héritée par les tâches asyncio du corps)
+_step_budget: contextvars.ContextVar = contextvars.ContextVar("step_budget")
+
+# ``[moteur, délai]`` de l'activation asyncio en cours : ``resume_after``
+# y écrit, même depuis le thread d'un noeud ``blocking`` (contexte copié)
+_activation: contextvars.ContextVar = contextvars.ContextVar("activation")
+
+def plan_keys(type_names: Iterable[str]) -> List[Tuple[str, str]]:
+    """``plan_key`` des types qui en déclarent un (sous-graphes), triés par nom."""
+    types = registry.types()
+    keys = []
+    for t in sorted(set(type_names)):
+        cls = types.get(t)
+        key = cls.plan_key() if cls is not None and hasattr(cls, "plan_key") else None
+        if key is not None:
+            keys.append((t, key))
+    return keys
+
+def graph_key(nodes: Iterable[NodeSpec], edges: Iterable[EdgeSpec],
+              type_keys: Optional[List[Tuple[str, str]]] = None) -> str:
+    """Empreinte structurelle des specs (ids, types, paramètres, arêtes).
+
+    Inclut ``type_keys`` (par défaut les ``plan_keys`` actuels des types).
+    """
+    node_specs = [(n.id, n.type_name, n.params) for n in nodes]
+    if type_keys is None:
+        type_keys = plan_keys(spec[1] for spec in node_specs)
+    specs = (node_specs, [(e.kind, e.src_id, e.src_port, e.dst_id, e.dst_port) for e in edges], type_keys)
+    try:
+        # version 2 : pas de références partagées, sortie indépendante des refcounts
+        data = marshal.dumps(specs, 2)
+    except ValueError:
+        # paramètre hors des types de base : repr, plus lent
+        data = repr(specs).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _process_in_worker(cls, params: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Exécute ``process`` dans un processus du pool (le noeud y est recréé)."""
+    return cls(**params).process(**kwargs)
+
 class ExecutionEngine:
     """
     Sépare data graph (DAG) et exec graph (événements).
     Hooks pour visualisation (on_node_start/finish, on_edge_fired).
+
+    ``scheduler`` choisit l'ordre des activations (``"fifo"``,
+    ``"depth_first"``, ``"priority"`` ou une instance de ``Scheduler``) et
+    ``max_steps`` borne le nombre d'étapes d'un run. Les noeuds ``loop``
+    (ForLoop, WhileLoop, ForEach) exécutent leur corps en boucle interne :
+    chaque itération draine le corps avec son propre budget de
+    ``max_steps`` étapes, et une boucle est limitée à ``max_iterations``.
+
+    Avec ``executor``, les sous-graphes purs disjoints en amont d'un noeud
+    d'exécution sont évalués en parallèle lorsqu'ils contiennent un noeud
+    déclarant ``concurrency`` ; ``process_executor`` reçoit les appels
+    ``process`` des noeuds ``concurrency = "process"``.
+
+    ``profiler`` (un ``EngineProfiler``) mesure chaque appel ``on_exec`` et
+    ``process`` ; sans profiler, la boucle ne fait aucune mesure.
+
+    Le graphe est interné dans ``graph`` (``GraphIndex`` : entiers et
+    tableaux CSR) et le plan compilé gardé dans ``compiled`` : un second
+    ``run`` ne recompile pas, et un ``CompiledGraph`` peut être fourni
+    directement (``nodes``/``edges`` sont alors ignorés) ; les identifiants chaînes ne servent plus qu'aux hooks et
+    à ``results``. ``instances``, ``data_incoming``, ``exec_outgoing``,
+    ``exec_nodes`` et ``pure_nodes`` sont des vues en lecture seule
+    reconstruites à la demande.
+
+    ``retention="all"`` garde dans ``results`` les dernières sorties de
+    chaque noeud. Avec ``retention="live"``, seuls les ports lus par une
+    arête de données sont conservés (mémoïsation et valeurs des noeuds
+    d'exécution) et ``results`` ne contient que les noeuds de ``watch``,
+    dont toutes les sorties sont gardées ; les hooks reçoivent toujours les
+    sorties complètes.
+
+    Un moteur peut être réutilisé d'un run à l'autre (``reset``) : les
+    instances de noeuds (et leurs ressources, un port série ouvert par
+    exemple) sont conservées tant que leur spec ne change pas.
+
+    Avec ``plan_cache`` (un ``PlanCache``), le plan compilé est relu depuis
+    le disque quand le même graphe a déjà été compilé, y compris par un
+    autre processus ; seules les instances de noeuds sont alors créées.
     """
-    def __init__(self, nodes: List[NodeSpec], edges: List[EdgeSpec], hooks: Optional[object] = None, vars_init: Optional[Dict[str, Any]] = None):
+    def __init__(self, nodes: List[NodeSpec], edges: List[EdgeSpec], hooks: Optional[object] = None, vars_init: Optional[Dict[str, Any]] = None,
+                 scheduler: Union[str, Scheduler] = "fifo", max_steps: int = DEFAULT_MAX_STEPS,
+                 executor: Optional[Executor] = None, process_executor: Optional[Executor] = None,
+                 profiler: Optional[EngineProfiler] = None,
+                 retention: str = "all", watch: Optional[Iterable[str]] = None,
+                 max_iterations: int = DEFAULT_MAX_ITERATIONS, compiled: Optional[CompiledGraph] = None,
+                 plan_cache: Optional[object] = None):
+        if retention not in RETENTION_MODES:
+            raise ValueError(f"Mode de rétention inconnu : {retention!r} (choix : {', '.join(RETENTION_MODES)})")
         self.nodes = {n.id: n for n in nodes}
         self.edges = edges
-        self.instances = {}
+        self.graph: Optional[GraphIndex] = None
+        self.compiled = compiled
+        self._is_exec: List[bool] = []
+        self._views: Optional[tuple] = None
+        # empreinte des specs (``graph_key``), calculée au premier ``reset``
+        self._key: Optional[str] = None
+        self._type_keys: Optional[List[Tuple[str, str]]] = None
+        self._dirty = True
+        self.plan_cache = plan_cache
+        self._cache_key: Optional[str] = None
         self.results: Dict[str, Dict[str, Any]] = {}
         self.hooks = hooks
         self._cancelled = False
         self.vars: Dict[str, Any] = dict(vars_init or {})
+        self.scheduler = scheduler
+        self.max_steps = max_steps
+        self.max_iterations = max_iterations
+        self.executor = executor
+        self.process_executor = process_executor
+        self.profiler = profiler
+        self.retention = retention
+        self.watch = frozenset(watch or ())
+
+        # plan compilé (voir ``_compile``) : tout est indexé par slot entier
+        self._plans: List[NodePlan] = []
+        self._slots: Dict[str, int] = {}
+        self._slot_nodes: List[Any] = []
+        self._values: List[Optional[Dict[str, Any]]] = []
+        self.steps = 0
+        # boucles asyncio : celle de ``run_async`` et celle qui attend les
+        # ``on_exec`` coroutines pendant un ``run`` synchrone
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._main_task: Optional[asyncio.Future] = None
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        # reprises différées (``resume_after``)
+        self._timers = TimerQueue()
+        self._pending_delay: Optional[float] = None
 
-        self.data_incoming: Dict[Tuple[str, str], Tuple[str, str]] = {}
-        self.exec_outgoing: DefaultDict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
-        self.pure_nodes: List[str] = []
-        self.exec_nodes: List[str] = []
+        # mémoïsation persistante des noeuds purs (voir ``_invalidate``)
+        self._pure_cache: List[Optional[Dict[str, Any]]] = []
+        self._volatile: List[bool] = []
+        self._data_succ: List[Tuple[int, ...]] = []
+        self._var_readers: Dict[str, List[int]] = {}
+        self._pure_order: List[int] = []
+        # nombre de noeuds remplacés par des littéraux (``_fold_constants``)
+        self.folded = 0
+        self._parallel_groups: Dict[int, Tuple[Tuple[int, ...], Tuple[Tuple[int, bool], ...]]] = {}
+        # ports vivants par slot (``retention="live"``) ; None : tout garder
+        self._keep: Optional[List[Optional[FrozenSet[str]]]] = None
+
+    def reset(self, nodes: List[NodeSpec], edges: List[EdgeSpec], vars_init: Optional[Dict[str, Any]] = None,
+              hooks: Optional[object] = None, profiler: Optional[EngineProfiler] = None,
+              retention: str = "all", watch: Optional[Iterable[str]] = None) -> bool:
+        """Prépare le prochain run sur ``nodes``/``edges`` ; retourne True si le graphe a changé.
+
+        Graphe identique (même ``graph_key``) : le plan compilé est gardé,
+        seuls les variables et l'état du run sont remis à zéro. Sinon, seuls
+        les noeuds dont la spec (type, paramètres) a changé sont
+        réinstanciés, les autres gardent leur instance, puis le plan est
+        reconstruit.
+        """
+        if retention not in RETENTION_MODES:
+            raise ValueError(f"Mode de rétention inconnu : {retention!r} (choix : {', '.join(RETENTION_MODES)})")
+        self.vars = dict(vars_init or {})
+        self.hooks = hooks
+        self.profiler = profiler
+        self.retention = retention
+        self.watch = frozenset(watch or ())
+        if self._key is None:
+            self._key = graph_key(self.nodes.values(), self.edges, self._type_keys)
+        key = graph_key(nodes, edges)
+        if key == self._key:
+            return False
+        self.nodes = {n.id: n for n in nodes}
+        self.edges = edges
+        self.compiled = None
+        self._key = key
+        self._dirty = True
+        return True
 
     def request_cancel(self):
         self._cancelled = True
+        # en mode asyncio, interrompt aussi les attentes en cours
+        loop = self._loop
+        if loop is not None and self._main_task is not None:
+            try:
+                loop.call_soon_threadsafe(self._main_task.cancel)
+            except RuntimeError:
+                pass
+
+    def resume_after(self, seconds: float):
+        """À appeler depuis ``on_exec`` : suspend la suite du noeud.
+
+        Les ports retournés par ``on_exec`` ne seront déclenchés (et
+        ``on_node_finish`` signalé) qu'après ``seconds`` secondes ; en
+        attendant, le moteur exécute les autres activations sans occuper
+        de thread ni de coeur.
+        """
+        delay = max(0.0, float(seconds))
+        cell = _activation.get(None)
+        if cell is not None and cell[0] is self:
+            # run_async : propre à l'activation, d'autres tournent en même temps
+            cell[1] = delay
+        else:
+            self._pending_delay = delay
+
+    def _take_delay(self) -> Optional[float]:
+        delay = self._pending_delay
+        self._pending_delay = None
+        return delay
+
+    def set_var(self, name: str, value: Any):
+        """Écrit une variable et invalide les noeuds purs qui la lisent."""
+        self.vars[name] = value
+        readers = self._var_readers.get(name)
+        if readers:
+            self._invalidate(readers)
+
+    @property
+    def instances(self) -> Mapping[str, Any]:
+        return SlotMapping(self._slots, self._slot_nodes)
+
+    @property
+    def data_incoming(self) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        return self._string_views()[0]
+
+    @property
+    def exec_outgoing(self) -> DefaultDict[Tuple[str, str], List[Tuple[str, str]]]:
+        return self._string_views()[1]
+
+    @property
+    def exec_nodes(self) -> List[str]:
+        return self._string_views()[2]
+
+    @property
+    def pure_nodes(self) -> List[str]:
+        return self._string_views()[3]
+
+    def _string_views(self) -> tuple:
+        """Tables indexées par chaînes, reconstruites depuis ``graph`` au premier accès."""
+        g = self.graph
+        if g is None:
+            return {}, defaultdict(list), [], []
+        if self._views is None:
+            ids, ports = g.ids, g.ports
+            data_incoming = {}
+            exec_outgoing = defaultdict(list)
+            for slot, nid in enumerate(ids):
+                for dp, src, sp in g.incoming(slot):
+                    data_incoming[(nid, ports[dp])] = (ids[src], ports[sp])
+                for sp, dst, dp in g.outgoing(slot):
+                    exec_outgoing[(nid, ports[sp])].append((ids[dst], ports[dp]))
+            exec_nodes = [nid for nid, x in zip(ids, self._is_exec) if x]
+            pure_nodes = [nid for nid, x in zip(ids, self._is_exec) if not x]
+            self._views = (data_incoming, exec_outgoing, exec_nodes, pure_nodes)
+        return self._views
 
     def _classify(self):
-        for nid, spec in self.nodes.items():
-            self.instances[nid] = registry.create(spec.type_name, **spec.params)
+        c = self.compiled
+        old, old_nodes = self.graph, self._slot_nodes
+        g = self.graph = c.graph if c is not None else GraphIndex(self.nodes.values(), self.edges)
+        self._views = None
+        self._slots = g.index
+        types = registry.types()
+        self._slot_nodes = []
+        for nid, t, p in zip(g.ids, g.type_names, g.params):
+            # instance précédente gardée si sa spec (et sa classe) est inchangée
+            prev = old.index.get(nid) if old is not None and old_nodes else None
+            if prev is not None and old.type_names[prev] == t and old.params[prev] == p \
+                    and type(old_nodes[prev]) is types.get(t):
+                self._slot_nodes.append(old_nodes[prev])
+                continue
+            inst = registry.create(t, **p)
             try:
-                setattr(self.instances[nid], '_engine', self)
+                setattr(inst, '_engine', self)
             except Exception:
                 pass
+            self._slot_nodes.append(inst)
+        self._is_exec = c.is_exec if c is not None else \
+            [bool(inst.exec_inputs() or inst.exec_outputs()) for inst in self._slot_nodes]
+
+    def _compile(self):
+        """Compile le graphe (une seule fois) puis prépare l'état du run."""
+        if self.compiled is None:
+            self.compiled = self._build_plan()
+            if self._cache_key is not None:
+                self.plan_cache.store(self._cache_key, self.compiled)
+        self._install(self.compiled)
+
+    def _load_plan(self):
+        """Cherche le plan compilé dans ``plan_cache`` (avant ``_classify``)."""
+        if self._key is None:
+            self._key = graph_key(self.nodes.values(), self.edges)
+        self._cache_key = self.plan_cache.key(self._key, (n.type_name for n in self.nodes.values()))
+        c = self.plan_cache.load(self._cache_key)
+        if c is not None and len(c.graph) == len(self.nodes):
+            self.compiled = c
+            self._cache_key = None
+
+    def _install(self, c: CompiledGraph):
+        """Adopte un plan compilé et remet à zéro l'état qui en dépend."""
+        n = len(c.plans)
+        self._plans = c.plans
+        self._data_succ = c.data_succ
+        self._var_readers = c.var_readers
+        self._volatile = c.volatile
+        self._pure_order = c.pure_order
+        self._values = [None] * n
+        self._pure_cache = [None] * n
+        for slot, out in c.folded.items():
+            self._pure_cache[slot] = out
+            self.results[c.plans[slot].id] = out
+        self.folded = len(c.folded)
+        self._plan_retention()
+        self._parallel_groups = self._plan_parallel_groups() if self.executor is not None else {}
+
+    def _build_plan(self) -> CompiledGraph:
+        """Construit le plan d'exécution à partir de ``graph`` (voir ``_classify``).
+
+        Chaque noeud reçoit un slot entier et une table figée de liaisons
+        d'entrée (source câblée ou valeur par défaut), ainsi que ses cibles
+        d'exécution. ``run`` n'utilise ensuite plus que ce plan.
+        """
+        g = self.graph
+        ids, ports = g.ids, g.ports
+        d_ptr, x_ptr = g.data_ptr, g.exec_ptr
 
-        for e in self.edges:
-            if e.kind == "data":
-                self.data_incoming[(e.dst_id, e.dst_port)] = (e.src_id, e.src_port)
+        plans = []
+        for slot, nid in enumerate(ids):
+            node = self._slot_nodes[slot]
+            # une entrée câblée plusieurs fois garde la dernière arête
+            wired = {ports[dp]: (src, ports[sp]) for dp, src, sp in g.incoming(slot)} \
+                if d_ptr[slot] != d_ptr[slot + 1] else {}
+            params = None
+            bindings = []
+            for in_name in node.inputs().keys():
+                src = wired.get(in_name)
+                if src is not None:
+                    bindings.append(InputBinding(in_name, src[0], src[1]))
+                else:
+                    if params is None:
+                        params = node.params()
+                    bindings.append(InputBinding(in_name, default=params.get(DEFAULT_PREFIX + in_name, None)))
+            is_exec = self._is_exec[slot]
+            exec_out = _NO_EXEC_OUT
+            if is_exec and x_ptr[slot] == x_ptr[slot + 1]:
+                exec_out = {port: () for port in node.exec_outputs()}
+            elif is_exec:
+                targets = defaultdict(list)
+                for sp, dst, dp in g.outgoing(slot):
+                    targets[ports[sp]].append((dst, ports[dp]))
+                exec_out = {port: tuple(targets.get(port, ())) for port in node.exec_outputs()}
+            plans.append(NodePlan(slot, nid, is_exec, tuple(bindings), exec_out))
+        self._plans = plans
+
+        # dépendances pour la mémoïsation : consommateurs purs de chaque slot,
+        # lecteurs de variables et noeuds non mémoïsables (et leur aval)
+        succ: List[List[int]] = [[] for _ in ids]
+        for plan in plans:
+            if plan.is_exec:
+                continue
+            for b in plan.bindings:
+                if b.src >= 0:
+                    succ[b.src].append(plan.slot)
+        self._data_succ = [tuple(s) for s in succ]
+        self._var_readers = {}
+        volatile = [False] * len(ids)
+        stack = []
+        for plan in plans:
+            if plan.is_exec:
+                continue
+            node = self._slot_nodes[plan.slot]
+            for name in node.variable_deps():
+                self._var_readers.setdefault(name, []).append(plan.slot)
+            if not getattr(node, 'cacheable', True):
+                stack.append(plan.slot)
+        while stack:
+            slot = stack.pop()
+            if volatile[slot]:
+                continue
+            volatile[slot] = True
+            stack.extend(self._data_succ[slot])
+        self._volatile = volatile
+        self._pure_order = self._topological_order()
+        folded = self._fold_constants()
+        return CompiledGraph(g, self._is_exec, self._plans, self._data_succ, self._var_readers,
+                             volatile, self._pure_order, folded)
+
+    def _topological_order(self) -> List[int]:
+        """Ordre topologique des noeuds purs (Kahn), calculé une seule fois.
+
+        Seules les arêtes entre noeuds purs comptent : un noeud d'exécution
+        fournit toujours sa dernière valeur enregistrée et coupe donc le
+        graphe de données. Lève ``RuntimeError`` si un cycle est détecté.
+        """
+        plans = self._plans
+        pending = [0] * len(plans)
+        for p in plans:
+            if not p.is_exec:
+                pending[p.slot] = sum(1 for b in p.bindings if b.src >= 0 and not plans[b.src].is_exec)
+        order = [p.slot for p in plans if not p.is_exec and pending[p.slot] == 0]
+        i = 0
+        while i < len(order):
+            for dst in self._data_succ[order[i]]:
+                pending[dst] -= 1
+                if pending[dst] == 0:
+                    order.append(dst)
+            i += 1
+        if len(order) < self._is_exec.count(False):
+            raise RuntimeError("Cycle dans le graphe de données : " + " -> ".join(self._find_cycle(pending)))
+        return order
+
+    def _find_cycle(self, pending: List[int]) -> List[str]:
+        """Extrait un cycle parmi les noeuds restés en attente dans Kahn."""
+        plans = self._plans
+        slot = next(i for i, n in enumerate(pending) if n > 0)
+        seen: Dict[int, int] = {}
+        path: List[int] = []
+        # chaque noeud en attente a au moins un prédécesseur pur en attente
+        while slot not in seen:
+            seen[slot] = len(path)
+            path.append(slot)
+            slot = next(b.src for b in plans[slot].bindings
+                        if b.src >= 0 and not plans[b.src].is_exec and pending[b.src] > 0)
+        cycle = path[seen[slot]:] + [slot]
+        cycle.reverse()
+        return [plans[s].id for s in cycle]
+
+    def _fold_constants(self) -> Dict[int, Dict[str, Any]]:
+        """Remplace les sous-graphes purs entièrement constants par des littéraux.
+
+        Un noeud est repliable si sa classe est ``foldable`` et que toutes ses
+        entrées sont des valeurs par défaut ou proviennent de noeuds déjà
+        repliés. Il est évalué une seule fois ici, puis les liaisons de ses
+        consommateurs deviennent des valeurs littérales dans le plan.
+        Retourne les sorties des noeuds repliés, par slot.
+        """
+        plans = self._plans
+        nodes = self._slot_nodes
+        folded: Dict[int, Dict[str, Any]] = {}
+        for slot in self._pure_order:
+            if not getattr(nodes[slot], 'foldable', False):
+                continue
+            kwargs = {}
+            for b in plans[slot].bindings:
+                if b.src < 0:
+                    kwargs[b.name] = b.default
+                elif b.src in folded:
+                    kwargs[b.name] = folded[b.src].get(b.port, None)
+                else:
+                    break
             else:
-                self.exec_outgoing[(e.src_id, e.src_port)].append((e.dst_id, e.dst_port))
+                try:
+                    folded[slot] = nodes[slot].process(**kwargs) or {}
+                except Exception:
+                    # l'erreur sera levée normalement à l'exécution
+                    pass
+
+        if folded:
+            for i, plan in enumerate(plans):
+                bindings = plan.bindings
+                for b in bindings:
+                    if b.src in folded:
+                        break
+                else:
+                    continue
+                bindings = tuple(
+                    InputBinding(b.name, port=b.port, default=folded[b.src].get(b.port, None), origin=b.src)
+                    if b.src in folded else b
+                    for b in bindings
+                )
+                plans[i] = NodePlan(plan.slot, plan.id, plan.is_exec, bindings, plan.exec_out)
+        return folded
+
+    def _plan_retention(self):
+        """Calcule les ports vivants pour ``retention="live"``.
+
+        Un port est vivant s'il est lu par une liaison du plan (après
+        repliement : une constante repliée n'est plus lue par personne).
+        Les noeuds surveillés gardent tout. Les valeurs déjà mémorisées sont
+        élaguées et ``results`` est restreint aux noeuds surveillés.
+        """
+        if self.retention == "all":
+            self._keep = None
+            return
+        plans = self._plans
+        live: List[set] = [set() for _ in plans]
+        for plan in plans:
+            for b in plan.bindings:
+                if b.src >= 0:
+                    live[b.src].add(b.port)
+        watch = self.watch
+        # un même ensemble de ports est partagé entre tous les slots qui l'ont
+        shared: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        self._keep = keep = [None if plan.id in watch else shared.setdefault(frozenset(ports), frozenset(ports))
+                             for plan, ports in zip(plans, live)]
+        cache = self._pure_cache
+        for slot, out in enumerate(cache):
+            if out is not None and keep[slot] is not None:
+                cache[slot] = {k: v for k, v in out.items() if k in keep[slot]}
+        self.results = {nid: out for nid, out in self.results.items() if nid in watch}
+
+    def _upstream(self, slot: int) -> set:
+        """Ensemble des noeuds purs dont dépend ``slot`` (inclus)."""
+        plans = self._plans
+        seen = set()
+        stack = [slot]
+        while stack:
+            s = stack.pop()
+            if s in seen:
+                continue
+            seen.add(s)
+            stack.extend(b.src for b in plans[s].bindings if b.src >= 0 and not plans[b.src].is_exec)
+        return seen
 
-        for nid, inst in self.instances.items():
-            if inst.exec_inputs() or inst.exec_outputs():
-                self.exec_nodes.append(nid)
+    def _plan_parallel_groups(self) -> Dict[int, Tuple[Tuple[int, ...], Tuple[Tuple[int, bool], ...]]]:
+        """Découpe l'amont pur de chaque noeud d'exécution en branches disjointes.
+
+        Les noeuds présents dans l'amont de plusieurs sources câblées sont
+        "partagés" et seront évalués d'abord ; le reste de chaque branche est
+        alors disjoint des autres. Une branche est "lourde" si sa partie propre
+        contient un noeud déclarant ``concurrency``. Seuls les noeuds ayant au
+        moins deux sources, dont une lourde, sont retenus.
+        """
+        plans = self._plans
+        nodes = self._slot_nodes
+        out = {}
+        for plan in plans:
+            if not plan.is_exec:
+                continue
+            srcs: List[int] = []
+            for b in plan.bindings:
+                if b.src >= 0 and not plans[b.src].is_exec and b.src not in srcs:
+                    srcs.append(b.src)
+            if len(srcs) < 2:
+                continue
+            closures = [self._upstream(src) for src in srcs]
+            count: Dict[int, int] = {}
+            for closure in closures:
+                for s in closure:
+                    count[s] = count.get(s, 0) + 1
+            branches = tuple(
+                (src, any(count[s] == 1 and getattr(nodes[s], 'concurrency', '') for s in closure))
+                for src, closure in zip(srcs, closures)
+                if count[src] == 1
+            )
+            if len(branches) > 1 and any(heavy for _, heavy in branches):
+                shared = tuple(s for s in self._pure_order if count.get(s, 0) > 1)
+                out[plan.slot] = (shared, branches)
+        return out
+
+    def _eval_groups(self, groups, cache: Dict[int, Dict[str, Any]]):
+        """Évalue les branches lourdes sur ``self.executor``, le reste ici.
+
+        Les noeuds partagés sont calculés en premier ; les branches restantes
+        écrivent alors des slots distincts et les résultats sont identiques à
+        une évaluation séquentielle. Toutes les tâches sont attendues avant de
+        propager la première erreur (dans l'ordre des entrées).
+        """
+        shared, branches = groups
+        pure_cache = self._pure_cache
+        for s in shared:
+            self._eval_node(s, cache)
+        pending = []
+        for src, heavy in branches:
+            if pure_cache[src] is not None:
+                continue
+            if heavy:
+                local = dict(cache)
+                pending.append((local, self.executor.submit(self._eval_node, src, local)))
             else:
-                self.pure_nodes.append(nid)
+                self._eval_node(src, cache)
+        error = None
+        for local, fut in pending:
+            try:
+                fut.result()
+            except Exception as e:
+                error = error or e
+            cache.update(local)
+        if error is not None:
+            raise error
 
-    def _eval_node(self, nid: str, cache: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """Évalue récursivement un noeud pour obtenir ses sorties.
+    def _invalidate(self, slots):
+        """Marque comme périmés ``slots`` et tous les noeuds purs en aval.
 
-        Les noeuds "purs" (sans ports d'exécution) sont recalculés à chaque
-        demande. Les noeuds avec ports d'exécution utilisent simplement la
-        dernière valeur disponible dans ``self.results``.
-        ``cache`` évite de recalculer plusieurs fois le même noeud pendant
-        l'évaluation d'un sous-graphe.
+        Un noeud périmé a forcément tout son aval périmé (l'aval ne peut être
+        recalculé sans lui), on s'arrête donc dès qu'on en rencontre un.
         """
-        if nid in cache:
-            return cache[nid]
+        cache = self._pure_cache
+        succ = self._data_succ
+        stack = list(slots)
+        while stack:
+            slot = stack.pop()
+            if cache[slot] is None:
+                continue
+            cache[slot] = None
+            stack.extend(succ[slot])
 
+    def _output_changed(self, slot: int):
+        """Un noeud d'exécution a publié de nouvelles sorties."""
+        consumers = self._data_succ[slot]
+        if consumers:
+            self._invalidate(consumers)
+
+    def _eval_node(self, slot: int, cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """Évalue un noeud et son amont pur pour obtenir ses sorties.
+
+        L'amont est parcouru avec une pile explicite (ordre postfixe, donc
+        topologique) : la profondeur des chaînes n'est pas limitée par la
+        pile Python et le coût est linéaire. Les cycles ayant été rejetés à
+        la compilation (``_topological_order``), le parcours termine.
+
+        Les noeuds "purs" (sans ports d'exécution) sont mémoïsés dans
+        ``self._pure_cache`` d'une étape à l'autre ; une entrée n'est
+        recalculée qu'après invalidation par une de ses dépendances (sortie
+        d'un noeud d'exécution en amont ou variable lue, cf. ``_invalidate``).
+        Les noeuds avec ports d'exécution utilisent simplement la dernière
+        valeur disponible dans ``self.results``.
+        ``cache`` sert aux noeuds non mémoïsables (``cacheable = False`` et
+        leur aval) pendant l'évaluation d'un sous-graphe.
+        """
+        plans = self._plans
+        pure_cache = self._pure_cache
         # Si le noeud possède des ports d'exécution, on ne le recalcule pas
         # ici : sa valeur provient de la dernière exécution enregistrée.
-        if nid in self.exec_nodes:
-            res = self.results.get(nid, {})
-            cache[nid] = res
-            return res
+        if plans[slot].is_exec:
+            return self._values[slot] or {}
+        hit = pure_cache[slot]
+        if hit is not None:
+            return hit
+        if slot in cache:
+            return cache[slot]
+
+        stack = [slot]
+        while stack:
+            top = stack[-1]
+            if pure_cache[top] is not None or top in cache:
+                stack.pop()
+                continue
+            bindings = plans[top].bindings
+            missing = False
+            for b in bindings:
+                src = b.src
+                if src >= 0 and not plans[src].is_exec and pure_cache[src] is None and src not in cache:
+                    stack.append(src)
+                    missing = True
+            if missing:
+                continue
+            stack.pop()
+            self._compute(top, cache)
+        out = pure_cache[slot]
+        return out if out is not None else cache[slot]
 
-        node = self.instances[nid]
-        params = node.params()
+    def _compute(self, slot: int, cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """Exécute ``process`` d'un noeud pur dont l'amont est disponible."""
+        plans = self._plans
+        pure_cache = self._pure_cache
+        plan = plans[slot]
         kwargs = {}
-        for in_name in node.inputs().keys():
-            if (nid, in_name) in self.data_incoming:
-                src_id, src_port = self.data_incoming[(nid, in_name)]
-                src_res = self._eval_node(src_id, cache)
-                kwargs[in_name] = src_res.get(src_port, None)
+        for b in plan.bindings:
+            src = b.src
+            if src < 0:
+                kwargs[b.name] = b.default
+                continue
+            if plans[src].is_exec:
+                res = self._values[src] or {}
             else:
-                key = DEFAULT_PREFIX + in_name
-                kwargs[in_name] = params.get(key, None)
-
-        out = node.process(**kwargs) or {}
-        cache[nid] = out
-        # mémorise la dernière valeur calculée mais elle ne sera pas réutilisée
-        # pour un prochain calcul car ``_eval_node`` ignore ``self.results`` pour
-        # les noeuds purs.
-        self.results[nid] = out
+                res = pure_cache[src]
+                if res is None:
+                    res = cache[src]
+            kwargs[b.name] = res.get(b.port, None)
+
+        node = self._slot_nodes[slot]
+        prof = self.profiler
+        if prof is not None:
+            start, cpu = prof.clock(), prof.cpu_clock()
+        if self.process_executor is not None and getattr(node, 'concurrency', '') == "process":
+            out = self.process_executor.submit(_process_in_worker, type(node), node._params, kwargs).result() or {}
+        else:
+            out = node.process(**kwargs) or {}
+        if prof is not None:
+            prof.record(plan.id, self.graph.type_names[slot], KIND_PROCESS, start,
+                        prof.clock() - start, prof.cpu_clock() - cpu)
+        keep = self._keep
+        if keep is None or keep[slot] is None:
+            self.results[plan.id] = out
+        else:
+            out = {k: v for k, v in out.items() if k in keep[slot]}
+        if self._volatile[slot]:
+            cache[slot] = out
+        else:
+            pure_cache[slot] = out
         return out
 
-    def _gather_inputs(self, nid: str) -> Dict[str, Any]:
-        node = self.instances[nid]
-        params = node.params()
-        cache: Dict[str, Dict[str, Any]] = {}
+    def _gather_inputs(self, slot: int) -> Dict[str, Any]:
+        cache: Dict[int, Dict[str, Any]] = {}
+        groups = self._parallel_groups.get(slot) if self._parallel_groups else None
+        if groups:
+            self._eval_groups(groups, cache)
         kwargs = {}
-        for in_name in node.inputs().keys():
-            # câble ?
-            if (nid, in_name) in self.data_incoming:
-                src_id, src_port = self.data_incoming[(nid, in_name)]
-                src_res = self._eval_node(src_id, cache)
-                kwargs[in_name] = src_res.get(src_port, None)
+        for b in self._plans[slot].bindings:
+            # câble ? sinon valeur par défaut précompilée
+            if b.src >= 0:
+                kwargs[b.name] = self._eval_node(b.src, cache).get(b.port, None)
             else:
-                # sinon valeur par défaut si présente
-                key = DEFAULT_PREFIX + in_name
-                kwargs[in_name] = params.get(key, None)
+                kwargs[b.name] = b.default
         return kwargs
 
-    def run(self) -> Dict[str, Dict[str, Any]]:
+    def evaluate_batch(self, columns: Dict[Tuple[str, str], Any], targets: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Évalue le graphe de données sur des colonnes (voir ``batch.evaluate_batch``)."""
+        from .batch import evaluate_batch
+        return evaluate_batch(self, columns, targets)
+
+    def _make_scheduler(self) -> Scheduler:
+        if isinstance(self.scheduler, Scheduler):
+            self.scheduler.clear()
+            return self.scheduler
+        nodes = self._slot_nodes
+        return make_scheduler(self.scheduler, key=lambda item: getattr(nodes[item[0]], 'priority', 0))
+
+    def _reclassify(self):
+        """Instancie les noeuds si le graphe est neuf ou a changé (``reset``)."""
+        if not self._dirty:
+            return
+        self._cache_key = None
+        cache = self.plan_cache
+        if self.compiled is None and cache is not None and len(self.nodes) >= cache.min_nodes:
+            self._load_plan()
+        if self._key is None:
+            # ``plan_key`` des types tels qu'ils sont compilés, pour l'empreinte
+            # calculée plus tard par ``reset`` (un sous-graphe a pu changer)
+            self._type_keys = plan_keys(n.type_name for n in self.nodes.values())
         self._classify()
+        self._dirty = False
+
+    def _prepare(self) -> List[int]:
+        """Compile le graphe (si besoin) et retourne les slots des noeuds d'entrée."""
+        self._reclassify()
+        self.results = {}
+        self._cancelled = False
+        self._pending_delay = None
+        self._compile()
+        nodes = self._slot_nodes
+        return [p.slot for p in self._plans if p.is_exec and not nodes[p.slot].exec_inputs()]
+
+    def _count_step(self):
+        self.steps += 1
+        budget = _step_budget.get()
+        budget[0] -= 1
+        if budget[0] < 0:
+            raise RuntimeError(f"Trop d'étapes d'exécution (> {self.max_steps}, possible boucle).")
+
+    def _begin(self, slot: int, came_from: Optional[str] = None) -> Dict[str, Any]:
+        """Rassemble les entrées d'un noeud d'exécution et signale son départ."""
+        kwargs = self._gather_inputs(slot)
+        if getattr(self._slot_nodes[slot], 'wants_exec_port', False):
+            kwargs["exec_port"] = came_from
+        if self.hooks and hasattr(self.hooks, "on_node_start"):
+            try: self.hooks.on_node_start(self._plans[slot].id)
+            except Exception: pass
+        return kwargs
+
+    def _finish(self, slot: int, next_ports, out) -> List[Tuple[int, str]]:
+        """Publie les sorties d'un noeud et retourne les activations déclenchées."""
+        nid = self._plans[slot].id
+        # notify outputs to hooks if available
+        if self.hooks and hasattr(self.hooks, "on_node_output"):
+            try: self.hooks.on_node_output(nid, out or {})
+            except Exception: pass
+
+        if self.hooks and hasattr(self.hooks, "on_node_finish"):
+            try: self.hooks.on_node_finish(nid)
+            except Exception: pass
+
+        self._publish(slot, out)
+        return self._fire(slot, next_ports)
+
+    def _publish(self, slot: int, out):
+        """Enregistre les sorties d'un noeud d'exécution et invalide son aval pur."""
+        nid = self._plans[slot].id
+        ports = None if self._keep is None else self._keep[slot]
+        if ports is None:
+            prev = self._values[slot]
+            if prev is None:
+                prev = self._values[slot] = self.results.setdefault(nid, {})
+            if out:
+                prev.update(out)
+                self._output_changed(slot)
+        elif out:
+            # seuls les ports lus en aval survivent (hors ``results``)
+            live = {k: v for k, v in out.items() if k in ports}
+            if live:
+                prev = self._values[slot]
+                if prev is None:
+                    prev = self._values[slot] = {}
+                prev.update(live)
+                self._output_changed(slot)
+
+    def _fire(self, slot: int, next_ports) -> List[Tuple[int, str]]:
+        """Activations des câbles partant de ``next_ports`` (hooks ``on_edge_fired``)."""
+        plan = self._plans[slot]
+        nid = plan.id
+        fired = []
+        for exec_port in next_ports or []:
+            for (dst, dst_port) in plan.exec_out.get(exec_port, ()):
+                if self.hooks and hasattr(self.hooks, "on_edge_fired"):
+                    try: self.hooks.on_edge_fired(nid, exec_port, self._plans[dst].id, dst_port)
+                    except Exception: pass
+                fired.append((dst, dst_port))
+        return fired
 
-        entry_nodes = [nid for nid in self.exec_nodes if not self.instances[nid].exec_inputs()]
-        queue: List[Tuple[str, Optional[str]]] = [(nid, None) for nid in entry_nodes]
-        steps = 0; max_steps = 10000
+    def _stamp(self, fired: List[Tuple[int, str]]) -> List[Tuple[int, str, float]]:
+        """Ajoute l'instant de mise en file aux activations (profilage)."""
+        now = self.profiler.clock()
+        return [(dst, port, now) for dst, port in fired]
 
-        while queue:
+    def _profiled_exec(self, slot: int, kwargs: Dict[str, Any], queued: float):
+        """``on_exec`` mesuré pour ``run`` : durée murale, CPU et attente en file."""
+        prof = self.profiler
+        start, cpu = prof.clock(), prof.cpu_clock()
+        res = self._slot_nodes[slot].on_exec(**kwargs)
+        if inspect.isawaitable(res):
+            res = self._await(res)
+        nid = self._plans[slot].id
+        prof.record(nid, self.graph.type_names[slot], KIND_EXEC, start,
+                    prof.clock() - start, prof.cpu_clock() - cpu, start - queued)
+        return res
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        entry_nodes = self._prepare()
+        queue = self._make_scheduler()
+        # avec profiler, une activation porte aussi son instant de mise en file
+        entries = [(slot, None) for slot in entry_nodes]
+        queue.extend(entries if self.profiler is None else self._stamp(entries))
+        self.steps = 0
+        timers = self._timers
+        timers.clear()
+        token = _step_budget.set([self.max_steps])
+        try:
+            self._drain(queue, timers)
+        finally:
+            _step_budget.reset(token)
+            timers.clear()
+            if self._sync_loop is not None:
+                self._sync_loop.close()
+                self._sync_loop = None
+        return self.results
+
+    def _drain(self, queue: Scheduler, timers: TimerQueue):
+        """Exécute les activations de ``queue`` (et reprises de ``timers``) jusqu'à épuisement."""
+        nodes = self._slot_nodes
+        prof = self.profiler
+        cancelled = lambda: self._cancelled
+
+        while queue or timers:
             if getattr(self, '_cancelled', False):
                 break
-            steps += 1
-            if steps > max_steps:
-                raise RuntimeError("Trop d'étapes d'exécution (possible boucle).")
+            if timers:
+                for slot, next_ports, out in timers.pop_due():
+                    fired = self._finish(slot, next_ports, out)
+                    if fired:
+                        queue.extend(fired if prof is None else self._stamp(fired))
+                if not queue:
+                    timers.wait(cancelled)
+                    continue
+            self._count_step()
 
-            nid, came_from = queue.pop(0)
-            node = self.instances[nid]
-            kwargs = self._gather_inputs(nid)
+            item = queue.pop()
+            slot = item[0]
+            kwargs = self._begin(slot, item[1])
+            if getattr(nodes[slot], 'loop', False):
+                fired = self._run_loop(slot, kwargs)
+                if fired:
+                    queue.extend(fired if prof is None else self._stamp(fired))
+                continue
+            if prof is None:
+                res = nodes[slot].on_exec(**kwargs)
+                if inspect.isawaitable(res):
+                    res = self._await(res)
+            else:
+                res = self._profiled_exec(slot, kwargs, item[2])
+            next_ports, out = res
+            delay = self._take_delay()
+            if delay is not None:
+                timers.schedule_after(delay, (slot, next_ports, out))
+                continue
+            fired = self._finish(slot, next_ports, out)
+            if fired:
+                queue.extend(fired if prof is None else self._stamp(fired))
 
-            if self.hooks and hasattr(self.hooks, "on_node_start"):
-                try: self.hooks.on_node_start(nid)
-                except Exception: pass
+    def _loop_body(self, slot: int, index: int, kwargs: Dict[str, Any]) -> Optional[List[Tuple[int, str]]]:
+        """Itération ``index`` d'une boucle : publie ses sorties et retourne
+        les activations du corps, ou None quand la boucle est terminée."""
+        out = self._slot_nodes[slot].loop_step(index, **kwargs)
+        if out is None or self._cancelled:
+            return None
+        if index >= self.max_iterations:
+            raise RuntimeError(f"Trop d'itérations dans la boucle {self._plans[slot].id} (> {self.max_iterations}).")
+        if self.hooks and hasattr(self.hooks, "on_node_output"):
+            try: self.hooks.on_node_output(self._plans[slot].id, out)
+            except Exception: pass
+        self._publish(slot, out)
+        return self._fire(slot, ("body",))
 
-            next_ports, out = node.on_exec(**kwargs)
+    def _body_scheduler(self) -> Scheduler:
+        """File dédiée au corps d'une boucle, du même type que celle du run."""
+        kind = self.scheduler.name if isinstance(self.scheduler, Scheduler) else self.scheduler
+        nodes = self._slot_nodes
+        return make_scheduler(kind or "fifo", key=lambda item: getattr(nodes[item[0]], 'priority', 0))
 
-            # notify outputs to hooks if available
-            if self.hooks and hasattr(self.hooks, "on_node_output"):
-                try: self.hooks.on_node_output(nid, out or {})
-                except Exception: pass
+    def _run_loop(self, slot: int, kwargs: Dict[str, Any]) -> List[Tuple[int, str]]:
+        """Exécute une boucle en place et retourne les activations de ``completed``.
 
-            if self.hooks and hasattr(self.hooks, "on_node_finish"):
-                try: self.hooks.on_node_finish(nid)
-                except Exception: pass
+        Chaque itération draine entièrement le corps (délais compris) dans
+        une file et un échéancier propres avant de passer à la suivante ; les
+        entrées de la boucle sont relues par ses liaisons compilées.
+        """
+        queue = self._body_scheduler()
+        timers = TimerQueue()
+        budget = [0]
+        token = _step_budget.set(budget)
+        try:
+            index = 0
+            while True:
+                fired = self._loop_body(slot, index, kwargs)
+                if fired is None:
+                    break
+                if fired:
+                    budget[0] = self.max_steps
+                    queue.extend(fired if self.profiler is None else self._stamp(fired))
+                    self._drain(queue, timers)
+                    if self._cancelled:
+                        return []
+                index += 1
+                kwargs = self._gather_inputs(slot)
+            if self._cancelled:
+                return []
+        finally:
+            _step_budget.reset(token)
+            timers.clear()
+        return self._finish(slot, ["completed"], {})
 
+    async def _run_loop_async(self, slot: int, kwargs: Dict[str, Any]) -> List[Tuple[int, str]]:
+        """Variante asyncio de ``_run_loop`` : le corps est attendu à chaque itération."""
+        budget = [0]
+        token = _step_budget.set(budget)
+        try:
+            index = 0
+            while True:
+                fired = self._loop_body(slot, index, kwargs)
+                if fired is None:
+                    break
+                if fired:
+                    budget[0] = self.max_steps
+                    if len(fired) == 1:
+                        await self._activate(*fired[0])
+                    else:
+                        await asyncio.gather(*(self._activate(dst, dst_port) for dst, dst_port in fired))
+                    if self._cancelled:
+                        return []
+                index += 1
+                kwargs = self._gather_inputs(slot)
+            if self._cancelled:
+                return []
+        finally:
+            _step_budget.reset(token)
+        return self._finish(slot, ["completed"], {})
 
+    def _await(self, awaitable):
+        """Attend un ``on_exec`` coroutine pendant un ``run`` synchrone.
 
-            prev = self.results.get(nid, {})
-            prev.update(out or {})
-            self.results[nid] = prev
+        L'exécution reste séquentielle ; pour que plusieurs attentes se
+        recouvrent, utiliser ``run_async``.
+        """
+        if self._sync_loop is None:
+            self._sync_loop = asyncio.new_event_loop()
+        return self._sync_loop.run_until_complete(awaitable)
 
-            for exec_port in next_ports or []:
-                for (dst_id, dst_port) in self.exec_outgoing.get((nid, exec_port), []):
-                    if self.hooks and hasattr(self.hooks, "on_edge_fired"):
-                        try: self.hooks.on_edge_fired(nid, exec_port, dst_id, dst_port)
-                        except Exception: pass
-                    queue.append((dst_id, dst_port))
+    async def run_async(self) -> Dict[str, Dict[str, Any]]:
+        """Variante asyncio de ``run`` : chaque activation devient une tâche.
 
+        Les branches issues d'un même port (ou de plusieurs noeuds d'entrée)
+        progressent en parallèle ; les noeuds ``blocking`` s'exécutent dans un
+        thread et les ``on_exec`` coroutines sont attendus sans bloquer la
+        boucle, pour que leur attente n'arrête pas les autres branches. Les
+        hooks restent dans l'ordre causal au sein d'une branche. Un noeud non
+        ``reentrant`` n'est jamais exécuté deux fois simultanément.
+        ``request_cancel`` annule les attentes en cours.
+        """
+        entry_nodes = self._prepare()
+        self.steps = 0
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._loop = asyncio.get_running_loop()
+        token = _step_budget.set([self.max_steps])
+        self._main_task = asyncio.ensure_future(asyncio.gather(*(self._activate(slot, None) for slot in entry_nodes)))
+        try:
+            await self._main_task
+        except asyncio.CancelledError:
+            if not self._cancelled:
+                raise
+        finally:
+            _step_budget.reset(token)
+            self._loop = None
+            self._timers.clear()
         return self.results
+
+    async def _activate(self, slot: int, came_from: Optional[str]):
+        nodes = self._slot_nodes
+        prof = self.profiler
+        while True:
+            if self._cancelled:
+                return
+            self._count_step()
+            node = nodes[slot]
+            if prof is not None:
+                queued = prof.clock()
+            lock = None
+            if not getattr(node, 'reentrant', False):
+                lock = self._locks.get(slot)
+                if lock is None:
+                    lock = self._locks[slot] = asyncio.Lock()
+                await lock.acquire()
+            delay = None
+            try:
+                kwargs = self._begin(slot, came_from)
+                if getattr(node, 'loop', False):
+                    fired = await self._run_loop_async(slot, kwargs)
+                else:
+                    if prof is not None:
+                        start, cpu = prof.clock(), prof.cpu_clock()
+                    cell = [self, None]
+                    act = _activation.set(cell)
+                    try:
+                        if getattr(node, 'blocking', False):
+                            res = await asyncio.to_thread(node.on_exec, **kwargs)
+                            cpu = None
+                        else:
+                            res = node.on_exec(**kwargs)
+                            if inspect.isawaitable(res):
+                                res = await res
+                                cpu = None
+                    finally:
+                        _activation.reset(act)
+                    if prof is not None:
+                        nid = self._plans[slot].id
+                        prof.record(nid, self.graph.type_names[slot], KIND_EXEC, start, prof.clock() - start,
+                                    0.0 if cpu is None else prof.cpu_clock() - cpu, start - queued)
+                    next_ports, out = res
+                    delay = cell[1]
+                    if delay is None:
+                        fired = self._finish(slot, next_ports, out)
+            finally:
+                if lock is not None:
+                    lock.release()
+            if delay is not None:
+                # hors du verrou : les branches qui convergent vers ce noeud
+                # attendent leurs délais en parallèle
+                await self._timers.sleep(delay)
+                fired = self._finish(slot, next_ports, out)
+            if len(fired) != 1:
+                break
+            # une seule suite : on la poursuit dans la même tâche
+            slot, came_from = fired[0]
+        if fired:
+            await asyncio.gather(*(self._activate(dst, dst_port) for dst, dst_port in fired))
@@ -1,36 +1,99 @@
-
+import asyncio
+from collections import deque
 from PyQt5 import QtCore
 from .engine import ExecutionEngine
+from .profiler import EngineProfiler
+
+# types d'événements du canal worker -> UI
+EV_START, EV_FINISH, EV_EDGE, EV_OUTPUT = range(4)
+
+FRAME_MS = 33          # cadence de vidage côté UI (~30 images/s)
+EDGE_BUDGET = 256      # flashs d'arêtes au plus par image
+RING_SIZE = 1 << 16    # événements cosmétiques gardés au plus entre deux images
+
+class HookEvents:
+    """Canal sans blocage entre le moteur (worker) et l'UI.
+
+    Le worker ajoute des tuples compacts ; ``deque.append``/``popleft`` sont
+    atomiques, aucun verrou ni signal Qt n'est nécessaire. Les événements
+    purement cosmétiques (début/fin de noeud, arêtes) vont dans un anneau
+    borné qui écrase les plus anciens ; les sorties ne sont jamais perdues.
+    """
+    def __init__(self, ring_size: int = RING_SIZE):
+        self.cosmetic = deque(maxlen=ring_size)
+        self.outputs = deque()
+
+    def drain(self):
+        """Retire ce qui est disponible : (cosmétiques, sorties)."""
+        cos, outs = [], []
+        pop = self.cosmetic.popleft
+        for _ in range(len(self.cosmetic)):
+            cos.append(pop())
+        pop = self.outputs.popleft
+        for _ in range(len(self.outputs)):
+            outs.append(pop())
+        return cos, outs
+
+    def clear(self):
+        self.cosmetic.clear(); self.outputs.clear()
 
 class _HooksBridge:
-    def __init__(self, emitter): self._emitter = emitter
-    def on_node_start(self, nid: str): self._emitter.sigNodeStarted.emit(nid)
-    def on_node_finish(self, nid: str): self._emitter.sigNodeFinished.emit(nid)
+    def __init__(self, events: HookEvents):
+        self._cos = events.cosmetic.append
+        self._out = events.outputs.append
+    def on_node_start(self, nid: str): self._cos((EV_START, nid))
+    def on_node_finish(self, nid: str): self._cos((EV_FINISH, nid))
     def on_edge_fired(self, src_id: str, src_port: str, dst_id: str, dst_port: str):
-        self._emitter.sigEdgeFired.emit(src_id, src_port, dst_id, dst_port)
-    def on_node_output(self, nid: str, out: dict): self._emitter.sigNodeOutput.emit(nid, out)
+        self._cos((EV_EDGE, (src_id, src_port, dst_id, dst_port)))
+    def on_node_output(self, nid: str, out: dict):
+        if out: self._out((EV_OUTPUT, nid, out))
 
 class EngineWorker(QtCore.QObject):
     sigRunStarted = QtCore.pyqtSignal()
     sigRunFinished = QtCore.pyqtSignal(dict)
-    sigNodeStarted = QtCore.pyqtSignal(str)
-    sigNodeFinished = QtCore.pyqtSignal(str)
-    sigEdgeFired = QtCore.pyqtSignal(str, str, str, str)
-    sigNodeOutput = QtCore.pyqtSignal(str, dict)
+    sigProfile = QtCore.pyqtSignal(object)
     sigError = QtCore.pyqtSignal(str)
 
-    @QtCore.pyqtSlot(list, list, dict)
-    def start_run(self, nodes, edges, vars_init):
+    def __init__(self, events: HookEvents, plan_cache=None):
+        super().__init__()
+        self._events = events
+        self._plan_cache = plan_cache
+        # moteur gardé entre les runs (voir ``ExecutionEngine.reset``)
+        self._warm = None
+
+    @QtCore.pyqtSlot(list, list, dict, dict)
+    def start_run(self, nodes, edges, vars_init, options):
         try:
             self.sigRunStarted.emit()
-            hooks = _HooksBridge(self)
-            self._engine = ExecutionEngine(nodes, edges, hooks=hooks, vars_init=vars_init)
-            results = self._engine.run()
+            hooks = _HooksBridge(self._events)
+            profiler = EngineProfiler() if options.get("profile") else None
+            retention, watch = options.get("retention", "all"), options.get("watch")
+            if self._warm is None or not options.get("warm", True):
+                self._warm = ExecutionEngine(nodes, edges, hooks=hooks, vars_init=vars_init, profiler=profiler,
+                                             retention=retention, watch=watch, plan_cache=self._plan_cache)
+            else:
+                self._warm.reset(nodes, edges, vars_init, hooks=hooks, profiler=profiler,
+                                 retention=retention, watch=watch)
+            self._engine = self._warm
+            if options.get("mode") == "async":
+                results = asyncio.run(self._engine.run_async())
+            else:
+                results = self._engine.run()
+            if profiler is not None:
+                # l'écriture de la trace reste hors du thread UI
+                if options.get("trace_path"):
+                    profiler.export_chrome_trace(options["trace_path"])
+                self.sigProfile.emit(profiler)
             self.sigRunFinished.emit(results)
             self._engine = None
         except Exception as e:
             self.sigError.emit(str(e))
 
+    @QtCore.pyqtSlot()
+    def discard(self):
+        """Oublie le moteur gardé : le prochain run repart d'instances neuves."""
+        self._warm = None
+
     def cancel(self):
         try:
             if hasattr(self, "_engine") and self._engine and hasattr(self._engine, "request_cancel"):
@@ -39,36 +102,93 @@ class EngineWorker(QtCore.QObject):
             pass
 
 class EngineRunner(QtCore.QObject):
+    """Exécute le moteur dans un thread et relaie ses hooks à l'UI.
+
+    Les hooks sont vidés par lots à ``FRAME_MS`` : les débuts/fins d'un même
+    noeud sont fusionnés (seul l'état final est signalé), les arêtes sont
+    dédoublonnées puis limitées à ``EDGE_BUDGET`` par image, les sorties
+    sont toutes relayées.
+
+    Le worker garde son moteur d'un run à l'autre : un graphe inchangé est
+    relancé sans recompilation et les noeuds inchangés gardent leur
+    instance (``ExecutionEngine.reset``). ``plan_cache`` (un ``PlanCache``)
+    garde en plus les plans compilés sur disque d'une session à l'autre.
+    """
     sigRunStarted = QtCore.pyqtSignal()
     sigRunFinished = QtCore.pyqtSignal(dict)
     sigNodeStarted = QtCore.pyqtSignal(str)
     sigNodeFinished = QtCore.pyqtSignal(str)
     sigEdgeFired = QtCore.pyqtSignal(str, str, str, str)
     sigNodeOutput = QtCore.pyqtSignal(str, dict)
+    sigProfile = QtCore.pyqtSignal(object)
     sigError = QtCore.pyqtSignal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, plan_cache=None):
         super().__init__(parent)
+        self._events = HookEvents()
+        self._frame = QtCore.QTimer(self); self._frame.setInterval(FRAME_MS)
+        self._frame.timeout.connect(self._drain)
         self._thread = QtCore.QThread(self)
-        self._worker = EngineWorker()
+        self._worker = EngineWorker(self._events, plan_cache)
         self._worker.moveToThread(self._thread)
-        # bubble up
-        self._worker.sigRunStarted.connect(self.sigRunStarted)
-        self._worker.sigRunFinished.connect(self.sigRunFinished)
-        self._worker.sigNodeStarted.connect(self.sigNodeStarted)
-        self._worker.sigNodeFinished.connect(self.sigNodeFinished)
-        self._worker.sigEdgeFired.connect(self.sigEdgeFired)
-        self._worker.sigNodeOutput.connect(self.sigNodeOutput)
-        self._worker.sigError.connect(self.sigError)
+        # bubble up (après un dernier vidage des hooks)
+        self._worker.sigRunStarted.connect(self._on_started)
+        self._worker.sigRunFinished.connect(self._on_finished)
+        self._worker.sigProfile.connect(self.sigProfile)
+        self._worker.sigError.connect(self._on_error)
         self._thread.start()
 
-    def start(self, nodes, edges, vars_init=None):
+    def start(self, nodes, edges, vars_init=None, mode="sync", profile=False, trace_path="",
+              retention="all", watch=None, warm=True):
+        """Lance un run dans le thread du worker (``mode`` : ``"sync"`` ou ``"async"``).
+
+        Avec ``profile``, ``sigProfile`` reçoit l'``EngineProfiler`` du run
+        (avant ``sigRunFinished``) ; ``trace_path`` y exporte une trace Chrome.
+        ``retention`` et ``watch`` sont transmis au moteur ; ``warm=False``
+        force un moteur neuf.
+        """
+        options = {"mode": mode, "profile": profile, "trace_path": trace_path,
+                   "retention": retention, "watch": list(watch or ()), "warm": warm}
         QtCore.QMetaObject.invokeMethod(self._worker, "start_run", QtCore.Qt.QueuedConnection,
-                                        QtCore.Q_ARG(list, nodes), QtCore.Q_ARG(list, edges), QtCore.Q_ARG(dict, vars_init or {}))
+                                        QtCore.Q_ARG(list, nodes), QtCore.Q_ARG(list, edges), QtCore.Q_ARG(dict, vars_init or {}),
+                                        QtCore.Q_ARG(dict, options))
 
     def stop(self):
         self._worker.cancel()
 
+    def discard_warm(self):
+        """Libère le moteur gardé (et les ressources de ses noeuds) avant le prochain run."""
+        QtCore.QMetaObject.invokeMethod(self._worker, "discard", QtCore.Qt.QueuedConnection)
+
+    def _on_started(self):
+        self._frame.start()
+        self.sigRunStarted.emit()
+
+    def _on_finished(self, results: dict):
+        self._frame.stop(); self._drain()
+        self.sigRunFinished.emit(results)
+
+    def _on_error(self, msg: str):
+        self._frame.stop(); self._drain()
+        self.sigError.emit(msg)
+
+    def _drain(self):
+        cos, outs = self._events.drain()
+        active = {}
+        edges = {}
+        for kind, payload in cos:
+            if kind == EV_EDGE:
+                if len(edges) < EDGE_BUDGET:
+                    edges[payload] = None
+            else:
+                active[payload] = kind == EV_START
+        for nid, flag in active.items():
+            (self.sigNodeStarted if flag else self.sigNodeFinished).emit(nid)
+        for key in edges:
+            self.sigEdgeFired.emit(*key)
+        for _, nid, out in outs:
+            self.sigNodeOutput.emit(nid, out)
+
     def deleteLater(self):
         try:
             self._thread.quit(); self._thread.wait(5000)
@@ -0,0 +1,167 @@
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from typing import Any, Iterable, List, Optional
+
+from .registry import registry
+
+# à incrémenter quand la structure de ``CompiledGraph`` change
+PLAN_FORMAT = 1
+MAGIC = b"NGPLAN1\0"
+SUFFIX = ".plan"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# en dessous, compiler coûte moins que lire (et écrire) une entrée
+DEFAULT_MIN_NODES = 1000
+
+
+def _module_stamp(name: str) -> tuple:
+    """Version d'un module : ``__version__`` ou date et taille de son fichier."""
+    mod = sys.modules.get(name)
+    version = getattr(mod, "__version__", None)
+    if version is not None:
+        return (name, str(version))
+    path = getattr(mod, "__file__", None)
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError):
+        return (name, None)
+    return (name, st.st_mtime_ns, st.st_size)
+
+
+class PlanCache:
+    """Cache disque des plans compilés (``CompiledGraph``).
+
+    Une entrée est indexée par l'empreinte des specs (``graph_key``), la
+    version des modules qui définissent les types utilisés (et du moteur)
+    et les ports de ces types. Elle est écrite en pickle compressé par
+    zlib et relue d'un bloc. Les fichiers les moins récemment lus sont
+    supprimés dès que le total dépasse ``max_bytes``.
+
+    Les graphes de moins de ``min_nodes`` noeuds ne sont pas mis en cache.
+    Un plan non sérialisable (constante repliée exotique) n'est simplement
+    pas mis en cache ; un fichier illisible est ignoré et supprimé.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES, compress_level: int = 1,
+                 min_nodes: int = DEFAULT_MIN_NODES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.min_nodes = min_nodes
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, graph_key: str, type_names: Iterable[str]) -> str:
+        types = registry.types()
+        modules = {"app.core.engine", "app.core.compact"}
+        ports = []
+        for t in sorted(set(type_names)):
+            cls = types.get(t)
+            if cls is None:
+                ports.append((t, None))
+                continue
+            modules.add(cls.__module__)
+            ports.append((t, tuple(cls.inputs()), tuple(cls.outputs()),
+                          tuple(cls.exec_inputs()), tuple(cls.exec_outputs())))
+        h = hashlib.blake2b(digest_size=20)
+        h.update(repr((PLAN_FORMAT, sys.version_info[:2], graph_key)).encode())
+        h.update(repr(sorted(_module_stamp(m) for m in modules)).encode())
+        h.update(repr(ports).encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, key: str) -> Optional[Any]:
+        """Plan compilé de ``key`` ou None (absent, corrompu ou périmé)."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            if not raw.startswith(MAGIC):
+                raise ValueError("en-tête invalide")
+            # memoryview : pas de copie de la charge avant décompression
+            data = zlib.decompress(memoryview(raw)[len(MAGIC):])
+            # des centaines de milliers de petits objets : sans le ramasse-miettes
+            # cyclique, qui se déclencherait sans rien trouver à collecter
+            enabled = gc.isenabled()
+            gc.disable()
+            try:
+                plan = pickle.loads(data)
+            finally:
+                if enabled:
+                    gc.enable()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            self.misses += 1
+            self._remove(path)
+            return None
+        # LRU : la date de modification sert de date de dernier accès
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return plan
+
+    def store(self, key: str, plan: Any) -> bool:
+        """Écrit ``plan`` (atomiquement) ; retourne False s'il n'est pas sérialisable."""
+        try:
+            data = zlib.compress(pickle.dumps(plan, protocol=pickle.HIGHEST_PROTOCOL), self.compress_level)
+        except Exception:
+            return False
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            self._remove(tmp)
+            return False
+        self.evict()
+        return True
+
+    def entries(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if e.is_file() and e.name.endswith(SUFFIX)]
+        except OSError:
+            return []
+
+    def size(self) -> int:
+        return sum(e.stat().st_size for e in self.entries())
+
+    def evict(self):
+        """Supprime les entrées les plus anciennes jusqu'à tenir dans ``max_bytes``."""
+        stats = []
+        for e in self.entries():
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            stats.append((st.st_mtime_ns, st.st_size, e.path))
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        for e in self.entries():
+            self._remove(e.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
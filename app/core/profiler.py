@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+# types d'appels mesurés
+KIND_EXEC = "on_exec"
+KIND_PROCESS = "process"
+
+
+class EngineProfiler:
+    """Mesures par appel ``on_exec`` / ``process`` d'un run du moteur.
+
+    Chaque appel enregistre son instant de début, sa durée murale, son temps
+    CPU (thread courant) et, pour les activations d'exécution, l'attente
+    dans la file du scheduler. ``summary`` agrège par noeud ou par type et
+    ``export_chrome_trace`` écrit un fichier lisible par chrome://tracing
+    ou Perfetto.
+
+    En mode asyncio, le temps CPU d'un ``on_exec`` attendu n'est pas mesuré
+    (d'autres tâches s'exécutent pendant l'attente) : il vaut 0.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter,
+                 cpu_clock: Callable[[], float] = time.thread_time):
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.origin = clock()
+        # (id, type, kind, début, mur, cpu, attente, thread)
+        self.records: List[tuple] = []
+
+    def record(self, node_id: str, type_name: str, kind: str, start: float,
+               wall: float, cpu: float = 0.0, wait: float = 0.0):
+        self.records.append((node_id, type_name, kind, start, wall, cpu, wait, threading.get_ident()))
+
+    def clear(self):
+        self.records.clear()
+        self.origin = self.clock()
+
+    def summary(self, by: str = "node") -> List[Dict[str, Any]]:
+        """Agrège les mesures par ``"node"`` (id) ou ``"type"``, triées par temps mural total."""
+        if by not in ("node", "type"):
+            raise ValueError(f"Regroupement inconnu : {by!r} (node ou type)")
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for nid, type_name, kind, _start, wall, cpu, wait, _tid in self.records:
+            key = (nid if by == "node" else type_name, kind)
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = {"name": key[0], "type": type_name, "kind": kind, "count": 0,
+                                   "wall": 0.0, "cpu": 0.0, "wait": 0.0, "max": 0.0}
+            row["count"] += 1
+            row["wall"] += wall
+            row["cpu"] += cpu
+            row["wait"] += wait
+            if wall > row["max"]:
+                row["max"] = wall
+        for row in rows.values():
+            row["mean"] = row["wall"] / row["count"]
+        return sorted(rows.values(), key=lambda r: r["wall"], reverse=True)
+
+    def format_summary(self, by: str = "type", limit: int = 15) -> str:
+        """Tableau texte (durées en ms) des ``limit`` entrées les plus coûteuses."""
+        rows = self.summary(by)
+        lines = [f"{'nom':<24} {'appel':<8} {'n':>6} {'mur':>10} {'moy':>9} {'max':>9} {'cpu':>10} {'file':>10}"]
+        for r in rows[:limit]:
+            lines.append(f"{r['name'][:24]:<24} {r['kind']:<8} {r['count']:>6} {r['wall'] * 1e3:>10.3f} "
+                         f"{r['mean'] * 1e3:>9.3f} {r['max'] * 1e3:>9.3f} {r['cpu'] * 1e3:>10.3f} {r['wait'] * 1e3:>10.3f}")
+        if len(rows) > limit:
+            lines.append(f"... {len(rows) - limit} autres")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Événements complets (``ph = "X"``) au format Trace Event, en microsecondes."""
+        tids: Dict[int, int] = defaultdict(lambda: len(tids))
+        events = []
+        for nid, type_name, kind, start, wall, cpu, wait, ident in self.records:
+            events.append({
+                "name": f"{type_name} {nid}", "cat": kind, "ph": "X", "pid": 1, "tid": tids[ident],
+                "ts": (start - self.origin) * 1e6, "dur": wall * 1e6,
+                "args": {"node": nid, "type": type_name, "cpu_us": cpu * 1e6, "wait_us": wait * 1e6},
+            })
+        for ident, tid in tids.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                           "args": {"name": "moteur" if tid == 0 else f"thread {ident}"}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,106 @@
+import heapq
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+
+# une activation : (slot du noeud, port d'exécution d'entrée ou None), suivie
+# de l'instant de mise en file quand le moteur est profilé
+Activation = Tuple[int, Optional[str]]
+
+
+class Scheduler:
+    """File des activations en attente du moteur.
+
+    ``push``/``pop`` sont en O(1) (O(log n) pour la file à priorités).
+    ``extend`` reçoit les cibles d'une même étape dans l'ordre des câbles.
+    """
+    name = ""
+
+    def push(self, item: Activation):
+        raise NotImplementedError
+
+    def extend(self, items: Iterable[Activation]):
+        for item in items:
+            self.push(item)
+
+    def pop(self) -> Activation:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class FifoScheduler(Scheduler):
+    """Largeur d'abord : ordre historique du moteur."""
+    name = "fifo"
+
+    def __init__(self):
+        self._q: deque = deque()
+
+    def push(self, item: Activation):
+        self._q.append(item)
+
+    def extend(self, items: Iterable[Activation]):
+        self._q.extend(items)
+
+    def pop(self) -> Activation:
+        return self._q.popleft()
+
+    def clear(self):
+        self._q.clear()
+
+    def __len__(self) -> int:
+        return len(self._q)
+
+
+class DepthFirstScheduler(FifoScheduler):
+    """Profondeur d'abord : une branche est suivie jusqu'au bout avant la suivante."""
+    name = "depth_first"
+
+    def extend(self, items: Iterable[Activation]):
+        # empilées à l'envers pour que la première cible sorte en premier
+        self._q.extend(reversed(list(items)))
+
+    def pop(self) -> Activation:
+        return self._q.pop()
+
+
+class PriorityScheduler(Scheduler):
+    """Plus petite priorité d'abord, FIFO à priorité égale."""
+    name = "priority"
+
+    def __init__(self, key: Optional[Callable[[Activation], Any]] = None):
+        self._key = key or (lambda item: 0)
+        self._heap: list = []
+        self._seq = 0
+
+    def push(self, item: Activation):
+        self._seq += 1
+        heapq.heappush(self._heap, (self._key(item), self._seq, item))
+
+    def pop(self) -> Activation:
+        return heapq.heappop(self._heap)[2]
+
+    def clear(self):
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+SCHEDULERS: Dict[str, Type[Scheduler]] = {
+    cls.name: cls for cls in (FifoScheduler, DepthFirstScheduler, PriorityScheduler)
+}
+
+
+def make_scheduler(kind: str, key: Optional[Callable[[Activation], Any]] = None) -> Scheduler:
+    """Instancie un ordonnanceur par nom (``fifo``, ``depth_first``, ``priority``)."""
+    try:
+        cls = SCHEDULERS[kind]
+    except KeyError:
+        raise ValueError(f"Ordonnanceur inconnu : {kind!r} (choix : {', '.join(SCHEDULERS)})")
+    if cls is PriorityScheduler:
+        return cls(key)
+    return cls()
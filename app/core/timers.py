@@ -0,0 +1,107 @@
+import asyncio
+import heapq
+import time
+from typing import Any, Callable, List, Optional
+
+# en dessous de ce délai, on termine l'attente en scrutant l'horloge
+_SPIN = 0.0005
+# une attente longue est découpée pour rester réactive à l'annulation
+_SLICE = 0.05
+# la boucle asyncio arrondit ses délais à la milliseconde : la fin de
+# l'attente est dormie par ``time.sleep`` (précis, sans scruter l'horloge)
+_ASYNC_TAIL = 0.0015
+
+
+class TimerQueue:
+    """Échéancier des reprises différées du moteur (tas binaire).
+
+    ``schedule`` est en O(log n) : des milliers d'attentes simultanées ne
+    coûtent rien tant qu'aucune n'est échue. ``wait`` dort jusqu'à la
+    prochaine échéance (CPU au repos) puis termine les dernières centaines
+    de microsecondes en scrutant l'horloge pour une précision sub-ms.
+    En mode asyncio, ``sleep`` enregistre un futur et une seule tâche
+    pilote réveille les échéances : elle attend la boucle jusqu'à ~1,5 ms
+    de l'échéance, puis dort le reste dans ``time.sleep`` (la boucle est
+    bloquée au plus ce temps-là, mais le CPU reste au repos même quand
+    les échéances sont denses).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self._heap: list = []
+        self._seq = 0
+        self._driver: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def schedule(self, deadline: float, item: Any):
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, item))
+
+    def schedule_after(self, delay: float, item: Any) -> float:
+        deadline = self.clock() + max(0.0, delay)
+        self.schedule(deadline, item)
+        return deadline
+
+    def next_deadline(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self) -> List[Any]:
+        """Retire les éléments échus, dans l'ordre de leurs échéances."""
+        due = []
+        heap = self._heap
+        if heap and heap[0][0] <= self.clock():
+            now = self.clock()
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap)[2])
+        return due
+
+    def wait(self, cancelled: Callable[[], bool] = lambda: False):
+        """Dort jusqu'à la prochaine échéance (ou jusqu'à une annulation)."""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return
+        while not cancelled():
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return
+            if remaining > _SPIN:
+                time.sleep(min(remaining - _SPIN, _SLICE))
+
+    async def sleep(self, delay: float):
+        """Suspend la tâche courante pendant ``delay`` secondes."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        deadline = self.schedule_after(delay, fut)
+        if self._driver is None or self._driver.done():
+            self._wake = asyncio.Event()
+            self._driver = loop.create_task(self._drive())
+        elif deadline <= self.next_deadline():
+            self._wake.set()
+        await fut
+
+    async def _drive(self):
+        while self._heap:
+            remaining = self._heap[0][0] - self.clock()
+            if remaining > _ASYNC_TAIL:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), min(remaining - _ASYNC_TAIL, _SLICE))
+                except asyncio.TimeoutError:
+                    pass
+            elif remaining > 0:
+                time.sleep(remaining)
+            else:
+                for fut in self.pop_due():
+                    if not fut.done():
+                        fut.set_result(None)
+                # laisse tourner les tâches réveillées avant la prochaine attente
+                await asyncio.sleep(0)
+
+    def clear(self):
+        self._heap.clear()
+        if self._driver is not None:
+            self._driver.cancel()
+            self._driver = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -1,7 +1,27 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 class BaseNode:
     reentrant: bool = False
+    # False : le moteur recalcule le noeud (et son aval) à chaque demande
+    cacheable: bool = True
+    # True : ``process`` ne dépend que de ses entrées et paramètres, le
+    # moteur peut l'évaluer une fois à la compilation si tout est constant
+    foldable: bool = False
+    # True : ``process_batch`` traite des colonnes entières (evaluate_batch)
+    vectorized: bool = False
+    # "" : évalué sur place ; "thread" : travail long qui relâche le GIL,
+    # "process" : calcul Python lourd à exécuter dans un pool de processus
+    concurrency: str = ""
+    # True : ``on_exec`` attend (I/O, délai) ; en mode asyncio il est
+    # exécuté dans un thread pour ne pas bloquer les autres branches
+    blocking: bool = False
+    # ordonnanceur "priority" : les plus petites valeurs s'exécutent d'abord
+    priority: int = 0
+    # True : boucle ; le moteur appelle ``loop_step`` à chaque itération au
+    # lieu de ``on_exec``, exécute "body" jusqu'au bout puis "completed"
+    loop: bool = False
+    # True : ``on_exec`` reçoit ``exec_port``, le port d'exécution d'entrée
+    wants_exec_port: bool = False
     def __init__(self, **params):
         self._params = params
 
@@ -31,6 +51,19 @@ class BaseNode:
     def exec_outputs(cls) -> List[str]:
         return []
 
+    @classmethod
+    def plan_key(cls) -> Optional[str]:
+        """Empreinte de ce qui, hors specs, détermine le plan (ex. corps d'un sous-graphe).
+
+        Incluse dans ``graph_key`` : le plan compilé (en mémoire ou sur
+        disque) d'un graphe utilisant ce type est reconstruit quand elle change.
+        """
+        return None
+
+    def variable_deps(self) -> List[str]:
+        """Noms des variables du moteur lues par ``process``."""
+        return []
+
     def params(self) -> Dict[str, Any]:
         # copie simple
         return dict(self._params)
@@ -38,6 +71,25 @@ class BaseNode:
     def process(self, **kwargs) -> Dict[str, Any]:
         return {}
 
+    def process_batch(self, **kwargs) -> Dict[str, Any]:
+        """Version vectorisée de ``process`` : entrées colonnes ou scalaires."""
+        raise NotImplementedError
+
+    def loop_step(self, index: int, **kwargs) -> Optional[Dict[str, Any]]:
+        """Boucles (``loop = True``) : sorties de l'itération ``index``, ou None pour terminer.
+
+        Les entrées sont relues avant chaque itération, après l'exécution
+        du corps précédent.
+        """
+        raise NotImplementedError
+
     def on_exec(self, **kwargs) -> Tuple[list, dict]:
+        """Exécute le noeud ; retourne (ports d'exécution à déclencher, sorties).
+
+        Une sous-classe peut le définir en ``async def`` pour attendre une
+        I/O : le moteur l'attend alors sans bloquer les autres branches
+        (``ExecutionEngine.run_async``). Pour un simple délai, appeler
+        ``ExecutionEngine.resume_after`` avant de retourner.
+        """
         outs = list(self.exec_outputs())[:1]
         return outs, {}
@@ -5,6 +5,7 @@ from ..core.registry import registry
 
 @registry.register
 class ConstInt(BaseNode):
+    foldable: bool = True
     CATEGORY = "Variables"
     COLOR = "#E06C75"
 
@@ -31,6 +32,7 @@ class ConstInt(BaseNode):
 
 @registry.register
 class ConstFloat(BaseNode):
+    foldable: bool = True
     CATEGORY = "Variables"
     COLOR = "#2BB1FF"
 
@@ -57,6 +59,7 @@ class ConstFloat(BaseNode):
 
 @registry.register
 class ConstBool(BaseNode):
+    foldable: bool = True
     CATEGORY = "Variables"
     COLOR = "#98C379"
 
@@ -78,6 +81,7 @@ class ConstBool(BaseNode):
 
 @registry.register
 class ConstString(BaseNode):
+    foldable: bool = True
     CATEGORY = "Variables"
     COLOR = "#C678DD"
 
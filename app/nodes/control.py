@@ -1,4 +1,5 @@
-from typing import Dict, Any, List, Tuple
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from .base import BaseNode
 from ..core.registry import registry
 
@@ -62,15 +63,111 @@ class Delay(BaseNode):
             secs = float(0.0 if seconds is None else seconds)
         except Exception:
             secs = 0.0
-        # Non-blocking-ish wait to keep UI responsive
-        try:
-            from PyQt5.QtCore import QCoreApplication
-            import time as _t
-            end = _t.monotonic() + max(0.0, secs)
-            while _t.monotonic() < end:
-                QCoreApplication.processEvents()
-                _t.sleep(0.01)
-        except Exception:
-            import time as _t
-            _t.sleep(max(0.0, secs))
+        eng = getattr(self, "_engine", None)
+        if eng is not None:
+            # le moteur reprendra "then" à l'échéance, sans attente active
+            eng.resume_after(secs)
+        else:
+            time.sleep(max(0.0, secs))
         return (["then"], {})
+
+@registry.register
+class ForLoop(BaseNode):
+    loop: bool = True
+    @classmethod
+    def title(cls):
+        return "For Loop"
+
+    @classmethod
+    def exec_inputs(cls):
+        return ["in"]
+
+    @classmethod
+    def exec_outputs(cls):
+        return ["body", "completed"]
+
+    @classmethod
+    def inputs(cls):
+        # bornes incluses
+        return {"first": int, "last": int}
+
+    @classmethod
+    def outputs(cls):
+        return {"index": int}
+
+    @classmethod
+    def category(cls):
+        return "Contrôle"
+
+    def loop_step(self, index: int, first=None, last=None, **_) -> Optional[Dict[str, Any]]:
+        i = int(first or 0) + index
+        return {"index": i} if i <= int(last or 0) else None
+
+@registry.register
+class WhileLoop(BaseNode):
+    loop: bool = True
+    @classmethod
+    def title(cls):
+        return "While Loop"
+
+    @classmethod
+    def exec_inputs(cls):
+        return ["in"]
+
+    @classmethod
+    def exec_outputs(cls):
+        return ["body", "completed"]
+
+    @classmethod
+    def inputs(cls):
+        # réévaluée avant chaque itération
+        return {"condition": bool}
+
+    @classmethod
+    def outputs(cls):
+        return {"index": int}
+
+    @classmethod
+    def category(cls):
+        return "Contrôle"
+
+    def loop_step(self, index: int, condition=None, **_) -> Optional[Dict[str, Any]]:
+        return {"index": index} if condition else None
+
+@registry.register
+class ForEach(BaseNode):
+    loop: bool = True
+    @classmethod
+    def title(cls):
+        return "For Each"
+
+    @classmethod
+    def exec_inputs(cls):
+        return ["in"]
+
+    @classmethod
+    def exec_outputs(cls):
+        return ["body", "completed"]
+
+    @classmethod
+    def inputs(cls):
+        # liste, tuple, chaîne... (None : aucune itération)
+        return {"array": object}
+
+    @classmethod
+    def outputs(cls):
+        return {"element": object, "index": int}
+
+    @classmethod
+    def category(cls):
+        return "Contrôle"
+
+    def loop_step(self, index: int, array=None, **_) -> Optional[Dict[str, Any]]:
+        if array is None:
+            return None
+        if not hasattr(array, "__getitem__") or not hasattr(array, "__len__"):
+            # itérable quelconque : matérialisé une fois tant que la source ne change pas
+            if index == 0 or getattr(self, "_source", None) is not array:
+                self._source, self._items = array, list(array)
+            array = self._items
+        return {"element": array[index], "index": index} if index < len(array) else None
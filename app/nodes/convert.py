@@ -4,6 +4,7 @@ from ..core.registry import registry
 
 @registry.register
 class IntToString(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -23,6 +24,7 @@ class IntToString(BaseNode):
 
 @registry.register
 class FloatToString(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -42,6 +44,7 @@ class FloatToString(BaseNode):
 
 @registry.register
 class BoolToString(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -1,9 +1,17 @@
 from typing import Dict, Any
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except Exception:
+    np = None
+    HAVE_NUMPY = False
+
 from .base import BaseNode
 from ..core.registry import registry
 
 @registry.register
 class ConstantNumber(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -26,6 +34,7 @@ class ConstantNumber(BaseNode):
 
 @registry.register
 class ConstantInt(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -48,6 +57,7 @@ class ConstantInt(BaseNode):
 
 @registry.register
 class ConstantBool(BaseNode):
+    foldable: bool = True
 
     @classmethod
     def category(cls):
@@ -66,6 +76,8 @@ class ConstantBool(BaseNode):
 
 @registry.register
 class Add(BaseNode):
+    foldable: bool = True
+    vectorized: bool = HAVE_NUMPY
 
     @classmethod
     def category(cls):
@@ -83,8 +95,15 @@ class Add(BaseNode):
         b = 0.0 if b is None else float(b)
         return {"sum": a + b}
 
+    def process_batch(self, a=None, b=None, **_) -> Dict[str, Any]:
+        a = 0.0 if a is None else np.asarray(a, dtype=float)
+        b = 0.0 if b is None else np.asarray(b, dtype=float)
+        return {"sum": a + b}
+
 @registry.register
 class Multiply(BaseNode):
+    foldable: bool = True
+    vectorized: bool = HAVE_NUMPY
 
     @classmethod
     def category(cls):
@@ -101,3 +120,8 @@ class Multiply(BaseNode):
         a = 0.0 if a is None else float(a)
         b = 0.0 if b is None else float(b)
         return {"product": a * b}
+
+    def process_batch(self, a=None, b=None, **_) -> Dict[str, Any]:
+        a = 0.0 if a is None else np.asarray(a, dtype=float)
+        b = 0.0 if b is None else np.asarray(b, dtype=float)
+        return {"product": a * b}
@@ -1,4 +1,6 @@
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
 from PyQt5 import QtCore
 try:
@@ -19,6 +21,10 @@ class WaitSerialMessage(BaseNode, QtCore.QObject):
         QtCore.QObject.__init__(self); BaseNode.__init__(self, **params)
         self._serial: Optional[QSerialPort] = None
         self._buffer = bytearray()
+        # le port vit dans ce thread dédié : les lectures bloquantes n'occupent
+        # ni la boucle du moteur ni un coeur
+        self._io: Optional[ThreadPoolExecutor] = None
+        self._stop = False
 
     @classmethod
     def title(cls): return "Wait Serial Message"
@@ -37,25 +43,28 @@ class WaitSerialMessage(BaseNode, QtCore.QObject):
             if self._serial.portName()==port and self._serial.baudRate()==baud: return True
             self._serial.close()
         self._serial = QSerialPort(); self._serial.setPortName(port); self._serial.setBaudRate(baud or 115200)
-        ok = self._serial.open(QSerialPort.ReadOnly)
-        if ok: self._serial.readyRead.connect(self._on_ready)
-        return ok
+        return self._serial.open(QSerialPort.ReadOnly)
 
-    def _on_ready(self):
-        if not self._serial: return
-        self._buffer.extend(self._serial.readAll().data())
-        if b"\n" in self._buffer:
-            line, _, rest = self._buffer.partition(b"\n"); self._buffer = bytearray(rest)
-            self._last_text = line.decode(errors="replace").rstrip("\r")
-            if self._loop and self._loop.isRunning():
-                self._serial.close()
-                self._loop.quit()
+    def _read_line(self, port: str, baud: int) -> str:
+        """Bloque (dans ``self._io``) jusqu'à la prochaine ligne reçue."""
+        if not self._ensure_open(port, baud): raise RuntimeError(f"Impossible d'ouvrir {port}")
+        while b"\n" not in self._buffer:
+            if self._stop: return ""
+            if self._serial.waitForReadyRead(100):
+                self._buffer.extend(self._serial.readAll().data())
+        line, _, rest = self._buffer.partition(b"\n"); self._buffer = bytearray(rest)
+        return line.decode(errors="replace").rstrip("\r")
 
-    def on_exec(self, **kwargs) -> Tuple[List[str], Dict[str, Any]]:
+    async def on_exec(self, **kwargs) -> Tuple[List[str], Dict[str, Any]]:
         port = kwargs.get("port") or self._params.get("port") or "COM3"
         baud = kwargs.get("baud") or self._params.get("baud") or 115200
-        if not self._ensure_open(port, baud): raise RuntimeError(f"Impossible d'ouvrir {port}")
-        self._last_text = ""
-        self._loop = QtCore.QEventLoop()
-        self._loop.exec_()  # no timeout by design
-        return (["then"], {"text": self._last_text})
+        if self._io is None:
+            self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="serial")
+        self._stop = False
+        try:
+            # no timeout by design
+            text = await asyncio.get_running_loop().run_in_executor(self._io, self._read_line, port, baud)
+        except asyncio.CancelledError:
+            self._stop = True
+            raise
+        return (["then"], {"text": text})
@@ -0,0 +1,338 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple, Type
+
+from .base import BaseNode
+from ..core.registry import registry
+from ..core.engine import (ExecutionEngine, CompiledGraph, NodeSpec, EdgeSpec,
+                           DEFAULT_MAX_STEPS, _step_budget, graph_key)
+
+# identifiants des noeuds frontières ajoutés au graphe d'une définition
+ENTRY_ID = "__entry__"
+EXIT_ID = "__exit__"
+CATEGORY = "Sous-graphes"
+
+
+@dataclass
+class SubgraphPort:
+    """Port déclaré d'un sous-graphe et ports internes qu'il relie.
+
+    Pour une entrée (données ou exécution), ``links`` liste les
+    ``(id, port)`` internes qui la reçoivent ; pour une sortie de données,
+    le premier lien est la source ; pour une sortie d'exécution, chaque
+    lien est une sortie d'exécution interne qui la déclenche.
+    """
+    name: str
+    links: List[Tuple[str, str]] = field(default_factory=list)
+    dtype: type = object
+
+
+@dataclass
+class SubgraphDefinition:
+    """Graphe nommé réutilisable comme un noeud (macro / fonction)."""
+    name: str
+    nodes: List[NodeSpec]
+    edges: List[EdgeSpec]
+    inputs: List[SubgraphPort] = field(default_factory=list)
+    outputs: List[SubgraphPort] = field(default_factory=list)
+    exec_inputs: List[SubgraphPort] = field(default_factory=list)
+    exec_outputs: List[SubgraphPort] = field(default_factory=list)
+    title: str = ""
+
+
+# définitions, plans compilés partagés, empreintes et versions, par nom
+_definitions: Dict[str, SubgraphDefinition] = {}
+_plans: Dict[str, CompiledGraph] = {}
+_keys: Dict[str, str] = {}
+_versions: Dict[str, int] = {}
+
+
+def _signature(defn: SubgraphDefinition) -> tuple:
+    """Interface vue par les graphes englobants."""
+    return (tuple((p.name, p.dtype) for p in defn.inputs), tuple((p.name, p.dtype) for p in defn.outputs),
+            tuple(p.name for p in defn.exec_inputs), tuple(p.name for p in defn.exec_outputs))
+
+
+def _users(name: str) -> List[str]:
+    """Définitions qui contiennent (directement ou non) le sous-graphe ``name``."""
+    found, stack = [], [name]
+    while stack:
+        inner = stack.pop()
+        for other, defn in _definitions.items():
+            if other not in found and any(n.type_name == inner for n in defn.nodes):
+                found.append(other)
+                stack.append(other)
+    return found
+
+
+def define_subgraph(defn: SubgraphDefinition) -> Type["SubgraphNode"]:
+    """Enregistre (ou remplace) une définition et retourne son type de noeud.
+
+    Le plan compilé de cette définition et ceux des définitions qui
+    l'utilisent sont invalidés : même à interface égale, leurs lecteurs de
+    variables et leur volatilité dérivent du corps. Les instances
+    existantes recompilent au prochain appel.
+    """
+    name = defn.name
+    existing = registry.types().get(name)
+    if existing is not None and getattr(existing, 'subgraph', None) != name:
+        raise ValueError(f"Le type {name!r} existe déjà et n'est pas un sous-graphe.")
+    if any(n.type_name == name for n in defn.nodes):
+        raise ValueError(f"Le sous-graphe {name!r} s'utilise lui-même.")
+    _definitions[name] = defn
+    _invalidate(name)
+
+    attrs = {"subgraph": name, "__module__": __name__}
+    registry.register(type(f"{name}:entry", (_SubgraphEntry,), dict(attrs)))
+    registry.register(type(f"{name}:exit", (_SubgraphExit,), dict(attrs)))
+    return registry.register(type(name, (SubgraphNode,), dict(attrs)))
+
+
+def remove_subgraph(name: str):
+    """Oublie une définition (les types restent enregistrés mais inutilisables)."""
+    _invalidate(name)
+    _definitions.pop(name, None)
+
+
+def _invalidate(name: str):
+    for n in [name] + _users(name):
+        _plans.pop(n, None)
+        _keys.pop(n, None)
+        _versions[n] = _versions.get(n, 0) + 1
+
+
+def definitions() -> Dict[str, SubgraphDefinition]:
+    return dict(_definitions)
+
+
+def _definition(name: str) -> SubgraphDefinition:
+    defn = _definitions.get(name)
+    if defn is None:
+        raise KeyError(f"Sous-graphe inconnu : {name!r}")
+    return defn
+
+
+def subgraph_key(name: str) -> str:
+    """Empreinte du corps et de l'interface de ``name`` (sous-graphes imbriqués compris)."""
+    key = _keys.get(name)
+    if key is None:
+        defn = _definition(name)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(graph_key(defn.nodes, defn.edges).encode())
+        h.update(repr((_signature(defn), [(p.name, p.links) for p in
+                                           defn.inputs + defn.outputs + defn.exec_inputs + defn.exec_outputs])).encode())
+        key = _keys[name] = h.hexdigest()
+    return key
+
+
+def compiled_plan(name: str) -> CompiledGraph:
+    """Plan compilé de la définition ``name``, construit au premier appel puis partagé."""
+    plan = _plans.get(name)
+    if plan is None:
+        defn = _definition(name)
+        nodes = list(defn.nodes) + [NodeSpec(ENTRY_ID, f"{name}:entry"), NodeSpec(EXIT_ID, f"{name}:exit")]
+        edges = list(defn.edges)
+        for p in defn.inputs:
+            edges += [EdgeSpec("data", ENTRY_ID, p.name, nid, port) for nid, port in p.links]
+        for p in defn.exec_inputs:
+            edges += [EdgeSpec("exec", ENTRY_ID, p.name, nid, port) for nid, port in p.links]
+        for p in defn.outputs:
+            edges += [EdgeSpec("data", nid, port, EXIT_ID, p.name) for nid, port in p.links[:1]]
+        for p in defn.exec_outputs:
+            edges += [EdgeSpec("exec", nid, port, EXIT_ID, p.name) for nid, port in p.links]
+        eng = ExecutionEngine(nodes, edges)
+        eng._classify()
+        plan = _plans[name] = eng._build_plan()
+    return plan
+
+
+class _SubgraphEntry(BaseNode):
+    """Frontière d'entrée : ses sorties sont les entrées de l'appel.
+
+    Toujours noeud d'exécution (port ``call`` jamais câblé) pour que le
+    moteur garde ses valeurs au lieu de les calculer.
+    """
+    HIDDEN = True
+    subgraph: str = ""
+
+    @classmethod
+    def outputs(cls):
+        return {p.name: p.dtype for p in _definition(cls.subgraph).inputs}
+
+    @classmethod
+    def exec_inputs(cls):
+        return ["call"]
+
+    @classmethod
+    def exec_outputs(cls):
+        return [p.name for p in _definition(cls.subgraph).exec_inputs]
+
+
+class _SubgraphExit(BaseNode):
+    """Frontière de sortie : ses entrées sont les sorties de l'appel."""
+    HIDDEN = True
+    subgraph: str = ""
+    wants_exec_port: bool = True
+
+    @classmethod
+    def inputs(cls):
+        return {p.name: p.dtype for p in _definition(cls.subgraph).outputs}
+
+    @classmethod
+    def exec_inputs(cls):
+        return [p.name for p in _definition(cls.subgraph).exec_outputs]
+
+    def on_exec(self, exec_port=None, **kwargs) -> Tuple[List[str], Dict[str, Any]]:
+        exits = self._engine.exits
+        if exec_port not in exits:
+            exits.append(exec_port)
+        return ([], {})
+
+
+class SubgraphEngine(ExecutionEngine):
+    """Moteur d'une instance de sous-graphe, construit sur le plan partagé.
+
+    Les variables sont celles du moteur parent (``set_var`` lui est
+    délégué pour invalider ses lecteurs) ; les étapes comptent dans le
+    budget de l'activation englobante et ``request_cancel`` du parent
+    interrompt le corps.
+    """
+    def __init__(self, compiled: CompiledGraph, parent: Optional[ExecutionEngine] = None):
+        super().__init__([], [], compiled=compiled, scheduler=getattr(parent, 'scheduler', "fifo"),
+                         max_steps=getattr(parent, 'max_steps', DEFAULT_MAX_STEPS))
+        self.parent = parent
+        if parent is not None:
+            self.max_iterations = parent.max_iterations
+            self.vars = parent.vars
+        self.exits: List[str] = []
+        self._locks = {}
+        self._classify()
+        self._compile()
+        self._entry = self._slots[ENTRY_ID]
+        self._exit = self._slots[EXIT_ID]
+
+    @property
+    def _cancelled(self) -> bool:
+        return self._cancel_flag or bool(self.parent is not None and self.parent._cancelled)
+
+    @_cancelled.setter
+    def _cancelled(self, value: bool):
+        self._cancel_flag = value
+
+    def set_var(self, name: str, value: Any):
+        if self.parent is not None:
+            self.parent.set_var(name, value)
+        super().set_var(name, value)
+
+    def enter(self, exec_port: Optional[str], values: Dict[str, Any]) -> List[Tuple[int, str]]:
+        """Publie les entrées de l'appel et retourne les activations de ``exec_port``."""
+        if self.parent is not None:
+            self.vars = self.parent.vars
+        # le parent a pu écrire des variables depuis l'appel précédent
+        for readers in self._var_readers.values():
+            self._invalidate(readers)
+        self.exits = []
+        self._publish(self._entry, values)
+        return self._fire(self._entry, [exec_port]) if exec_port is not None else []
+
+    def drain(self, fired: List[Tuple[int, str]]):
+        if not fired:
+            return
+        queue = self._body_scheduler()
+        queue.extend(fired)
+        # hors d'un run (appel direct), l'appel a son propre budget
+        token = _step_budget.set([self.max_steps]) if _step_budget.get(None) is None else None
+        try:
+            self._drain(queue, self._timers)
+        finally:
+            if token is not None:
+                _step_budget.reset(token)
+            self._timers.clear()
+
+    def leave(self) -> Tuple[List[str], Dict[str, Any]]:
+        """Ports de sortie déclenchés et sorties de données de l'appel."""
+        return list(self.exits), self._gather_inputs(self._exit)
+
+
+class SubgraphNode(BaseNode):
+    """Instance d'un sous-graphe défini par ``define_subgraph``.
+
+    Toutes les instances d'une définition partagent son plan compilé
+    (``compiled_plan``) ; chacune garde son propre moteur (et donc l'état
+    de ses noeuds internes) d'un appel à l'autre. Un appel exécute le
+    sous-graphe jusqu'au bout puis déclenche, une fois chacune, les
+    sorties d'exécution atteintes. Sans ports d'exécution, le sous-graphe
+    est un noeud pur évalué par ``process``.
+    """
+    subgraph: str = ""
+    wants_exec_port: bool = True
+
+    @classmethod
+    def type_name(cls) -> str:
+        return cls.subgraph
+
+    @classmethod
+    def title(cls) -> str:
+        defn = _definitions.get(cls.subgraph)
+        return (defn and defn.title) or cls.subgraph
+
+    @classmethod
+    def category(cls) -> str:
+        return CATEGORY
+
+    @classmethod
+    def inputs(cls):
+        return {p.name: p.dtype for p in _definition(cls.subgraph).inputs}
+
+    @classmethod
+    def outputs(cls):
+        return {p.name: p.dtype for p in _definition(cls.subgraph).outputs}
+
+    @classmethod
+    def exec_inputs(cls):
+        return [p.name for p in _definition(cls.subgraph).exec_inputs]
+
+    @classmethod
+    def exec_outputs(cls):
+        return [p.name for p in _definition(cls.subgraph).exec_outputs]
+
+    @classmethod
+    def plan_key(cls) -> Optional[str]:
+        return subgraph_key(cls.subgraph) if cls.subgraph in _definitions else None
+
+    @property
+    def cacheable(self) -> bool:
+        return not any(compiled_plan(self.subgraph).volatile)
+
+    def variable_deps(self) -> List[str]:
+        return list(compiled_plan(self.subgraph).var_readers)
+
+    def _child(self) -> SubgraphEngine:
+        """Moteur interne, reconstruit si la définition a changé depuis."""
+        version = _versions.get(self.subgraph)
+        child = getattr(self, "_sub_engine", None)
+        if child is None or self._sub_version != version:
+            child = self._sub_engine = SubgraphEngine(compiled_plan(self.subgraph), getattr(self, "_engine", None))
+            self._sub_version = version
+        return child
+
+    def process(self, **kwargs) -> Dict[str, Any]:
+        child = self._child()
+        child.enter(None, kwargs)
+        return child.leave()[1]
+
+    def on_exec(self, exec_port=None, **kwargs):
+        child = self._child()
+        fired = child.enter(exec_port, kwargs)
+        parent = getattr(self, "_engine", None)
+        if parent is not None and parent._loop is not None:
+            return self._run_async(child, fired)
+        child.drain(fired)
+        return child.leave()
+
+    async def _run_async(self, child: SubgraphEngine, fired):
+        """Appel depuis ``run_async`` : le corps progresse comme des tâches du parent."""
+        if fired:
+            await asyncio.gather(*(child._activate(dst, port) for dst, port in fired))
+        return child.leave()
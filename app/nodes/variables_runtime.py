@@ -24,6 +24,9 @@ class GetVariable(BaseNode):
     @classmethod
     def inputs(cls): return {}
 
+    def variable_deps(self) -> List[str]:
+        return [self._params.get("name", "")]
+
     def process(self, **kwargs) -> Dict[str, Any]:
         eng = getattr(self, "_engine", None)
         if not eng: raise RuntimeError("Engine indisponible.")
@@ -51,5 +54,5 @@ class SetVariable(BaseNode):
         name = self._params.get("name", "")
         tname = self._params.get("type", "String")
         val = _cast(kwargs.get("value", None), tname)
-        eng.vars[name] = val
+        eng.set_var(name, val)
         return (["then"], {})
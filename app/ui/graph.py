@@ -1,4 +1,4 @@
-from PyQt5 import QtWidgets, QtGui, QtCore
+from PyQt5 import QtWidgets, QtGui, QtCore, sip
 from typing import Dict, List, Tuple, Optional
 from ..core.engine import NodeSpec, EdgeSpec, DEFAULT_PREFIX
 from ..core.registry import registry
@@ -21,6 +21,8 @@ TYPE_COLORS = {
 }
 EXEC_COLOR = QtGui.QColor("#FFFFFF")
 FLOW_COLOR = QtGui.QColor("#FF9A00")
+FLOW_TICK_MS = 30
+FLOW_WIDTH = 4
 
 def is_compatible(src_t, dst_t) -> bool:
     """Return True if two port types can be connected.
@@ -38,6 +40,18 @@ NODE_H = 140
 HEADER_H = 24
 PORT_MARGIN = 24
 
+# level of detail, chosen by GraphView from its zoom factor
+LOD_FULL = 0       # everything
+LOD_SIMPLE = 1     # nodes as coloured rectangles: no text, ports or editors
+LOD_OVERVIEW = 2   # same, and edges drawn as straight lines
+LOD_SIMPLE_SCALE = 0.5
+LOD_OVERVIEW_SCALE = 0.25
+
+def detail_level(scale: float) -> int:
+    if scale < LOD_OVERVIEW_SCALE: return LOD_OVERVIEW
+    if scale < LOD_SIMPLE_SCALE: return LOD_SIMPLE
+    return LOD_FULL
+
 class ControlPointItem(QtWidgets.QGraphicsEllipseItem):
     def __init__(self, edge: "EdgeItem", pos: QtCore.QPointF):
         super().__init__(-5, -5, 10, 10)
@@ -54,8 +68,9 @@ class ControlPointItem(QtWidgets.QGraphicsEllipseItem):
         self.setPos(pos)
 
     def itemChange(self, change, value):
-        if change in (QtWidgets.QGraphicsItem.ItemPositionChange, QtWidgets.QGraphicsItem.ItemPositionHasChanged):
-            self.edge.update_path()
+        if change == QtWidgets.QGraphicsItem.ItemPositionHasChanged:
+            scene = self.scene()
+            if scene is not None: scene.invalidate_edge_paths((self.edge,))
         return super().itemChange(change, value)
 
     def mouseDoubleClickEvent(self, event):
@@ -73,105 +88,183 @@ class InputLabelItem(QtWidgets.QGraphicsSimpleTextItem):
         self.dtype = dtype
         self.setBrush(QtGui.QBrush(QtGui.QColor(220,220,220)))
 
-class InputEditor(QtWidgets.QGraphicsProxyWidget):
-    def __init__(self, node_item: "NodeItem", name: str, dtype: type):
-        super().__init__(node_item)
+EDITOR_H = 22
+
+class InlineField(QtWidgets.QGraphicsRectItem):
+    """Value of a node parameter drawn as plain text.
+
+    No widget is attached: when the field gets focus, the scene's
+    InlineEditorPool lends it a live editor and takes it back afterwards.
+    Booleans are toggled in place.
+    """
+    def __init__(self, node_item: "NodeItem", param_key: str, dtype: type, width: int, placeholder: str = ""):
+        super().__init__(0, 0, EDITOR_H if dtype is bool else width, EDITOR_H, node_item)
         self.node_item = node_item
-        self.input_name = name
+        self.param_key = param_key
         self.dtype = dtype
+        self.placeholder = placeholder
         self.setZValue(2)
+        self.setBrush(QtGui.QBrush(QtGui.QColor(40,40,48)))
+        self.setPen(QtGui.QPen(QtGui.QColor(90,90,110), 1))
+        self.setFlag(QtWidgets.QGraphicsItem.ItemIsFocusable, True)
+        self.setCursor(QtCore.Qt.PointingHandCursor if dtype is bool else QtCore.Qt.IBeamCursor)
+        self.text_item = QtWidgets.QGraphicsSimpleTextItem(self)
+        self.text_item.setPos(4, 3)
+        self.refresh()
+
+    def default(self):
+        return "" if self.dtype is str else (False if self.dtype is bool else 0)
+
+    def value(self):
+        return self.node_item._params.get(self.param_key, self.default())
+
+    def set_value(self, value):
+        self.node_item._params[self.param_key] = value
+        self.refresh()
+
+    def text(self) -> str:
+        val = self.value()
+        if self.dtype is bool: return "\u2713" if val else ""
+        if self.dtype is int:
+            try: return str(int(val) if val != "" else 0)
+            except Exception: return "0"
+        if self.dtype is float:
+            try: return QtCore.QLocale().toString(float(val), "f", 6)
+            except Exception: return QtCore.QLocale().toString(0.0, "f", 6)
+        return str(val)
+
+    def refresh(self):
+        text = self.text()
+        color = QtGui.QColor(230,230,230) if text or not self.placeholder else QtGui.QColor(130,130,140)
+        metrics = QtGui.QFontMetrics(self.text_item.font())
+        self.text_item.setText(metrics.elidedText(text or self.placeholder, QtCore.Qt.ElideRight, int(self.rect().width()) - 8))
+        self.text_item.setBrush(QtGui.QBrush(color))
 
-        if dtype is int:
-            w = QtWidgets.QSpinBox(); w.setRange(-10**9, 10**9)
-        elif dtype is float:
-            w = QtWidgets.QDoubleSpinBox(); w.setDecimals(6); w.setRange(-1e12, 1e12); w.setSingleStep(0.1)
-        elif dtype is bool:
-            w = QtWidgets.QCheckBox()
-        else:
-            w = QtWidgets.QLineEdit(); w.setPlaceholderText("valeur...")
+    def mousePressEvent(self, event):
+        if self.dtype is bool and event.button() == QtCore.Qt.LeftButton:
+            self.set_value(not bool(self.value())); event.accept(); return
+        super().mousePressEvent(event)
 
-        self.widget = w
-        self.widget.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self.setWidget(w)
-        self.setAcceptedMouseButtons(QtCore.Qt.AllButtons)
-        self.setFlag(QtWidgets.QGraphicsItem.ItemIsFocusable, True)
+    def keyPressEvent(self, event):
+        if self.dtype is bool and event.key() == QtCore.Qt.Key_Space:
+            self.set_value(not bool(self.value())); event.accept(); return
+        super().keyPressEvent(event)
 
-        key = DEFAULT_PREFIX + name
-        if dtype is bool:
-            self.widget.setChecked(bool(self.node_item._params.get(key, False)))
-            self.widget.stateChanged.connect(self._on_change)
-        else:
-            val = self.node_item._params.get(key, "" if dtype is str else 0)
-            if isinstance(self.widget, QtWidgets.QLineEdit):
-                self.widget.setText(str(val))
-                self.widget.textChanged.connect(self._on_change)
-            elif isinstance(self.widget, QtWidgets.QSpinBox):
-                self.widget.setValue(int(val) if val != "" else 0)
-                self.widget.valueChanged.connect(self._on_change)
-            elif isinstance(self.widget, QtWidgets.QDoubleSpinBox):
-                try: self.widget.setValue(float(val))
-                except Exception: self.widget.setValue(0.0)
-                self.widget.valueChanged.connect(self._on_change)
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        scene = self.scene()
+        if scene is not None and self.dtype is not bool: scene.inline_editors.open(self)
 
-    def _on_change(self, *args):
-        if self.dtype is bool:
-            self.node_item._params[DEFAULT_PREFIX + self.input_name] = bool(self.widget.isChecked())
-        elif isinstance(self.widget, QtWidgets.QLineEdit):
-            self.node_item._params[DEFAULT_PREFIX + self.input_name] = self.widget.text()
-        elif isinstance(self.widget, QtWidgets.QSpinBox):
-            self.node_item._params[DEFAULT_PREFIX + self.input_name] = int(self.widget.value())
-        elif isinstance(self.widget, QtWidgets.QDoubleSpinBox):
-            self.node_item._params[DEFAULT_PREFIX + self.input_name] = float(self.widget.value())
-
-class OutputEditor(QtWidgets.QGraphicsProxyWidget):
-    def __init__(self, node_item: "NodeItem", out_name: str, dtype: type):
-        super().__init__(node_item)
-        self.node_item = node_item
+class InputEditor(InlineField):
+    def __init__(self, node_item: "NodeItem", name: str, dtype: type, width: int = 140):
+        super().__init__(node_item, DEFAULT_PREFIX + name, dtype, width, placeholder="valeur...")
+        self.input_name = name
+
+class OutputEditor(InlineField):
+    def __init__(self, node_item: "NodeItem", out_name: str, dtype: type, width: int = 150):
+        super().__init__(node_item, "value" if out_name == "value" else f"out:{out_name}", dtype, width)
         self.out_name = out_name
-        self.dtype = dtype
-        self.setZValue(2)
 
+class _EditorProxy(QtWidgets.QGraphicsProxyWidget):
+    """Live editor widget of one type, lent by InlineEditorPool to the focused field."""
+    def __init__(self, pool: "InlineEditorPool", dtype: type):
+        super().__init__()
+        self.pool = pool
+        self.dtype = dtype
+        self.setZValue(3)
         if dtype is int:
             w = QtWidgets.QSpinBox(); w.setRange(-10**9, 10**9)
+            w.valueChanged.connect(self._on_change)
         elif dtype is float:
             w = QtWidgets.QDoubleSpinBox(); w.setDecimals(6); w.setRange(-1e12, 1e12); w.setSingleStep(0.1)
-        elif dtype is bool:
-            w = QtWidgets.QCheckBox()
+            w.valueChanged.connect(self._on_change)
         else:
             w = QtWidgets.QLineEdit()
-
+            w.textChanged.connect(self._on_change)
+        # Enter, or focus leaving the widget
+        w.editingFinished.connect(pool.close)
+        w.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.widget = w
-        self.widget.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setWidget(w)
-        self.setAcceptedMouseButtons(QtCore.Qt.AllButtons)
-        self.setFlag(QtWidgets.QGraphicsItem.ItemIsFocusable, True)
-
-        param_key = "value" if out_name == "value" else f"out:{out_name}"
-        self.param_key = param_key
-        val = self.node_item._params.get(param_key, "" if dtype is str else (False if dtype is bool else 0))
-        if dtype is bool:
-            self.widget.setChecked(bool(val))
-            self.widget.stateChanged.connect(self._on_change)
-        elif isinstance(self.widget, QtWidgets.QLineEdit):
-            self.widget.setText(str(val))
-            self.widget.textChanged.connect(self._on_change)
-        elif isinstance(self.widget, QtWidgets.QSpinBox):
-            self.widget.setValue(int(val) if val != "" else 0)
-            self.widget.valueChanged.connect(self._on_change)
-        elif isinstance(self.widget, QtWidgets.QDoubleSpinBox):
-            try: self.widget.setValue(float(val))
-            except Exception: self.widget.setValue(0.0)
-            self.widget.valueChanged.connect(self._on_change)
+        self.hide()
+
+    def load(self, field: InlineField):
+        w = self.widget
+        w.blockSignals(True)
+        try:
+            val = field.value()
+            if isinstance(w, QtWidgets.QSpinBox):
+                try: w.setValue(int(val) if val != "" else 0)
+                except Exception: w.setValue(0)
+            elif isinstance(w, QtWidgets.QDoubleSpinBox):
+                try: w.setValue(float(val))
+                except Exception: w.setValue(0.0)
+            else:
+                w.setText(str(val)); w.setPlaceholderText(field.placeholder)
+        finally:
+            w.blockSignals(False)
+        w.setFixedWidth(int(field.rect().width()))
 
     def _on_change(self, *args):
-        if self.dtype is bool:
-            self.node_item._params[self.param_key] = bool(self.widget.isChecked())
-        elif isinstance(self.widget, QtWidgets.QLineEdit):
-            self.node_item._params[self.param_key] = self.widget.text()
-        elif isinstance(self.widget, QtWidgets.QSpinBox):
-            self.node_item._params[self.param_key] = int(self.widget.value())
-        elif isinstance(self.widget, QtWidgets.QDoubleSpinBox):
-            self.node_item._params[self.param_key] = float(self.widget.value())
+        field = self.pool.field
+        if field is None: return
+        w = self.widget
+        if isinstance(w, QtWidgets.QSpinBox): field.set_value(int(w.value()))
+        elif isinstance(w, QtWidgets.QDoubleSpinBox): field.set_value(float(w.value()))
+        else: field.set_value(w.text())
+
+class InlineEditorPool:
+    """Editor widgets shared by every InlineField of a scene.
+
+    At most one proxy per value type exists, whatever the node count. It is
+    placed over the focused field and hidden again when editing finishes;
+    the value is written to the node params as it is typed.
+    """
+    def __init__(self, scene: "GraphScene"):
+        self.scene = scene
+        self._proxies: Dict[type, _EditorProxy] = {}
+        self.field: Optional[InlineField] = None
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    @staticmethod
+    def _kind(dtype: type) -> type:
+        # spin boxes for numbers, a line edit for everything else
+        return dtype if dtype in (int, float) else str
+
+    def _proxy(self, dtype: type) -> _EditorProxy:
+        kind = self._kind(dtype)
+        proxy = self._proxies.get(kind)
+        # deleted with a node or by scene.clear()
+        if proxy is None or sip.isdeleted(proxy):
+            proxy = self._proxies[kind] = _EditorProxy(self, kind)
+        if proxy.scene() is not self.scene:
+            self.scene.addItem(proxy)
+        return proxy
+
+    def open(self, field: InlineField):
+        if field is self.field: return
+        self.close()
+        proxy = self._proxy(field.dtype)
+        proxy.load(field)
+        proxy.setParentItem(field.parentItem()); proxy.setPos(field.pos())
+        self.field = field
+        proxy.show(); proxy.setFocus(QtCore.Qt.OtherFocusReason); proxy.widget.selectAll()
+
+    def close(self):
+        field, self.field = self.field, None
+        if field is None: return
+        proxy = self._proxies.get(self._kind(field.dtype))
+        if proxy is not None and not sip.isdeleted(proxy):
+            # detached so that deleting the node does not delete the proxy
+            proxy.hide(); proxy.setParentItem(None)
+        if not sip.isdeleted(field): field.refresh()
+
+    def close_for(self, node: "NodeItem"):
+        """Give the editor back before ``node`` is removed or hides its fields."""
+        if self.field is not None and not sip.isdeleted(self.field) and self.field.node_item is node:
+            self.close()
 
 class PortItem(QtWidgets.QGraphicsEllipseItem):
     def __init__(self, name: str, is_output: bool, parent_node: "NodeItem", kind: str, dtype: type = object):
@@ -183,7 +276,7 @@ class PortItem(QtWidgets.QGraphicsEllipseItem):
         self.is_output = is_output
         self.parent_node = parent_node
         self.edges: List["EdgeItem"] = []
-        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsScenePositionChanges, True)
+        # ports only move with their node: NodeItem.itemChange invalidates the edges
         self.setAcceptHoverEvents(True)
         self._update_appearance()
 
@@ -217,12 +310,6 @@ class PortItem(QtWidgets.QGraphicsEllipseItem):
         self.setScale(1.0)
         super().hoverLeaveEvent(e)
 
-    def itemChange(self, change, value):
-        if change == QtWidgets.QGraphicsItem.ItemScenePositionHasChanged:
-            for e in list(self.edges):
-                e.update_path()
-        return super().itemChange(change, value)
-
 class EdgeItem(QtWidgets.QGraphicsPathItem):
     def __init__(self, kind: str, src_port: PortItem, dst_port: PortItem = None):
         super().__init__()
@@ -234,7 +321,6 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         self.control_points: List[ControlPointItem] = []
         self.setFlags(QtWidgets.QGraphicsItem.ItemIsSelectable)
         self.flow_active = False
-        self.flow_phase = 0.0
         self.flow_ttl = 0
         self._reset_pen()
         self.update_path()
@@ -249,22 +335,38 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         self.setPen(pen)
 
     def start_flow(self, duration_ms=600):
-        self.flow_active = True
-        self.flow_ttl = max(self.flow_ttl, duration_ms // 30)
-        pen = QtGui.QPen(FLOW_COLOR, 4)
-        pen.setDashPattern([6, 8])
-        pen.setDashOffset(self.flow_phase)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        self.setPen(pen)
+        # the scene owns the animation (see GraphScene._on_tick)
+        scene = self.scene()
+        if scene is None: return
+        self.flow_ttl = max(self.flow_ttl, duration_ms // FLOW_TICK_MS)
+        if not self.flow_active:
+            self.set_flow_active(True)
+            scene._start_flow(self)
+
+    def set_flow_active(self, flag: bool):
+        # the flow pen is wider than the regular one: grow the bounding rect
+        self.prepareGeometryChange()
+        self.flow_active = flag
+        if not flag:
+            self.flow_ttl = 0
+        self.update()
 
-    def tick_flow(self):
-        if not self.flow_active: return
-        self.flow_phase += 1.5
-        pen = self.pen(); pen.setDashOffset(self.flow_phase); self.setPen(pen)
-        self.flow_ttl -= 1
-        if self.flow_ttl <= 0:
-            self.flow_active = False
-            self._reset_pen()
+    def boundingRect(self):
+        r = super().boundingRect()
+        if self.flow_active:
+            m = FLOW_WIDTH / 2
+            r = r.adjusted(-m, -m, m, m)
+        return r
+
+    def paint(self, painter, option, widget=None):
+        scene = self.scene()
+        if self.flow_active and scene is not None:
+            # shared pens, dash offset advanced once per frame by the scene;
+            # zoomed out, the dashes would be sub-pixel: solid line instead
+            painter.setPen(scene.flow_pen if scene.detail_level < LOD_OVERVIEW else scene.flow_pen_solid)
+            painter.drawPath(self.path())
+            return
+        super().paint(painter, option, widget)
 
     def update_path(self, end_pos: QtCore.QPointF = None):
         p = QtGui.QPainterPath()
@@ -272,6 +374,11 @@ class EdgeItem(QtWidgets.QGraphicsPathItem):
         dst = self.dst_port.center_in_scene() if self.dst_port is not None else (end_pos or self.src_port.center_in_scene())
         points = [src] + [cp.scenePos() for cp in self.control_points] + [dst]
         p.moveTo(points[0])
+        scene = self.scene()
+        if scene is not None and scene.detail_level >= LOD_OVERVIEW:
+            for pt in points[1:]: p.lineTo(pt)
+            self.setPath(p)
+            return
         for i in range(1, len(points)):
             a = points[i-1]; b = points[i]
             dx = abs(b.x() - a.x())
@@ -332,6 +439,8 @@ class NodeItem(QtWidgets.QGraphicsObject):
             QtWidgets.QGraphicsItem.ItemIsSelectable |
             QtWidgets.QGraphicsItem.ItemSendsGeometryChanges
         )
+        # drawn entirely by child items: spare the view a paint() call per node
+        self.setFlag(QtWidgets.QGraphicsItem.ItemHasNoContents, True)
         self.setAcceptHoverEvents(True)
 
         self.inputs: Dict[str, PortItem] = {}
@@ -341,8 +450,11 @@ class NodeItem(QtWidgets.QGraphicsObject):
         self.input_labels: Dict[str, InputLabelItem] = {}
         self.input_editors: Dict[str, InputEditor] = {}
         self.output_editors: Dict[str, OutputEditor] = {}
+        self.output_labels: Dict[str, QtWidgets.QGraphicsSimpleTextItem] = {}
+        self.detail = LOD_FULL
 
         self._build_ports_and_editors()
+        for t in self._text_items(): t.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
     # QGraphicsObject requires boundingRect/paint
     def boundingRect(self):
@@ -377,7 +489,7 @@ class NodeItem(QtWidgets.QGraphicsObject):
             p.setPos(0, y)
             lbl = InputLabelItem(self, name, dtype); lbl.setPos(10, y-8)
             self.inputs[name] = p; self.input_labels[name] = lbl
-            ed = InputEditor(self, name, dtype); ed.setPos(95, y-14); ed.widget.setFixedWidth(140)
+            ed = InputEditor(self, name, dtype); ed.setPos(95, y-11)
             self.input_editors[name] = ed
             y += PORT_MARGIN
 
@@ -388,21 +500,27 @@ class NodeItem(QtWidgets.QGraphicsObject):
             txt = QtWidgets.QGraphicsSimpleTextItem(name, self)
             txt.setBrush(QtGui.QBrush(QtGui.QColor(220,220,220)))
             w = txt.boundingRect().width(); txt.setPos(NODE_W - w - 18, y-8)
-            self.outputs[name] = p
+            self.outputs[name] = p; self.output_labels[name] = txt
             if not ins:
                 out_ed = OutputEditor(self, name, dtype)
-                out_ed.setPos(NODE_W - 170, y-14); out_ed.widget.setFixedWidth(150)
+                out_ed.setPos(NODE_W - 170, y-11)
                 self.output_editors[name] = out_ed
             y += PORT_MARGIN
 
         self.refresh_inline_editors()
 
     def refresh_inline_editors(self):
+        full = self.detail == LOD_FULL
         for name, ed in self.input_editors.items():
             wired = len(self.inputs[name].edges) > 0
-            ed.setVisible(not wired)
+            ed.setVisible(full and not wired)
         for name, ed in self.output_editors.items():
-            ed.setVisible(True)
+            ed.setVisible(full)
+        scene = self.scene()
+        if scene is not None:
+            field = scene.inline_editors.field
+            if field is not None and field.node_item is self and not field.isVisible():
+                scene.inline_editors.close()
         # Apply instance port type overrides
         pt = self._params.get('_port_types') if isinstance(self._params, dict) else None
         if pt:
@@ -414,6 +532,38 @@ class NodeItem(QtWidgets.QGraphicsObject):
                     self.inputs[name].dtype = dtype
                     self.inputs[name]._update_appearance()
 
+    def _text_items(self):
+        yield self.title_item
+        if self.subtitle_item: yield self.subtitle_item
+        yield from self.input_labels.values()
+        yield from self.output_labels.values()
+        for ed in self.input_editors.values(): yield ed.text_item
+        for ed in self.output_editors.values(): yield ed.text_item
+
+    def set_detail(self, level: int):
+        """Show the full node or only a coloured rectangle (see detail_level)."""
+        if level == self.detail: return
+        was_full = self.detail == LOD_FULL
+        self.detail = level
+        full = level == LOD_FULL
+        if full == was_full: return
+        # hidden text drops its cached pixmap; visible text is drawn from one
+        cache = QtWidgets.QGraphicsItem.DeviceCoordinateCache if full else QtWidgets.QGraphicsItem.NoCache
+        for t in self._text_items():
+            t.setVisible(full); t.setCacheMode(cache)
+        for ports in (self.inputs, self.outputs, self.exec_inputs, self.exec_outputs):
+            for port in ports.values(): port.setVisible(full)
+        self.bg.setVisible(full)
+        self.header.setRect(0, 0, NODE_W, HEADER_H if full else NODE_H)
+        self.refresh_inline_editors()
+
+    def remove_output_editor(self, name: str):
+        ed = self.output_editors.pop(name, None)
+        scene = self.scene()
+        if ed is None or scene is None: return
+        if scene.inline_editors.field is ed: scene.inline_editors.close()
+        scene.removeItem(ed)
+
     def params(self) -> dict:
         return dict(self._params)
 
@@ -429,9 +579,11 @@ class NodeItem(QtWidgets.QGraphicsObject):
                 x = round(pos.x() / GRID_SIZE) * GRID_SIZE
                 y = round(pos.y() / GRID_SIZE) * GRID_SIZE
                 return QtCore.QPointF(x, y)
-            for port in list(self.inputs.values()) + list(self.outputs.values()) + list(self.exec_inputs.values()) + list(self.exec_outputs.values()):
-                for e in list(port.edges):
-                    e.update_path()
+            scene = self.scene()
+            if change == QtWidgets.QGraphicsItem.ItemPositionHasChanged and scene is not None:
+                for ports in (self.inputs, self.outputs, self.exec_inputs, self.exec_outputs):
+                    for port in ports.values():
+                        if port.edges: scene.invalidate_edge_paths(port.edges)
         return super().itemChange(change, value)
 
 class EditableTextItem(QtWidgets.QGraphicsTextItem):
@@ -545,24 +697,95 @@ class GraphScene(QtWidgets.QGraphicsScene):
         self.nodes: Dict[str, NodeItem] = {}
         self.edges: List[EdgeItem] = []
         self.comments: List[CommentItem] = []
+        # (src_id, src_port, dst_id, dst_port) -> exec edge, for mark_exec_edge
+        self.exec_edge_index: Dict[Tuple[str, str, str, str], EdgeItem] = {}
 
         self._temp_edge: Optional[EdgeItem] = None
         self._temp_src_port: Optional[PortItem] = None
 
-        self._timer = QtCore.QTimer(); self._timer.timeout.connect(self._on_tick); self._timer.start(30)
+        # flow animation: only the animating edges are tracked, and the timer
+        # runs only while there is at least one of them
+        self._flowing: Dict[EdgeItem, None] = {}
+        self.flow_pen = QtGui.QPen(FLOW_COLOR, FLOW_WIDTH)
+        self.flow_pen.setDashPattern([6, 8])
+        self.flow_pen.setCapStyle(QtCore.Qt.RoundCap)
+        self.flow_pen_solid = QtGui.QPen(FLOW_COLOR, FLOW_WIDTH)
+        self._flow_phase = 0.0
+        self._timer = QtCore.QTimer(self); self._timer.setInterval(FLOW_TICK_MS)
+        self._timer.timeout.connect(self._on_tick)
+        # edges whose path must be rebuilt, once per frame (see flush_edge_paths)
+        self._dirty_edges: Dict[EdgeItem, None] = {}
+        self.detail_level = LOD_FULL
+        self.inline_editors = InlineEditorPool(self)
+
+    def clear(self):
+        # the items are deleted: forget the ones still referenced for later work
+        self._flowing.clear(); self._timer.stop()
+        self._dirty_edges.clear()
+        super().clear()
+
+    def set_detail_level(self, level: int):
+        """Apply a level of detail to every node and edge (called by GraphView on zoom)."""
+        if level == self.detail_level: return
+        straight = (self.detail_level >= LOD_OVERVIEW) != (level >= LOD_OVERVIEW)
+        self.detail_level = level
+        for node in self.nodes.values(): node.set_detail(level)
+        if straight and self.edges: self.invalidate_edge_paths(self.edges)
+
+    def invalidate_edge_paths(self, edges):
+        """Mark edges for a path rebuild before the next paint, instead of rebuilding now.
+
+        Moving a selection notifies every node separately, so an edge shared by two
+        moved nodes would otherwise be rebuilt several times per frame.
+        """
+        if not self._dirty_edges:
+            QtCore.QTimer.singleShot(0, self.flush_edge_paths)
+        self._dirty_edges.update(dict.fromkeys(edges))
+
+    def flush_edge_paths(self):
+        """Rebuild every dirty edge path once (also called by GraphView before painting)."""
+        dirty = self._dirty_edges
+        if not dirty: return
+        self._dirty_edges = {}
+        for e in dirty:
+            if not sip.isdeleted(e) and e.scene() is self: e.update_path()
+
+    def _start_flow(self, edge: EdgeItem):
+        self._flowing[edge] = None
+        if not self._timer.isActive():
+            self._timer.start()
 
     def _on_tick(self):
-        for e in list(self.edges): e.tick_flow()
+        self._flow_phase += 1.5
+        self.flow_pen.setDashOffset(self._flow_phase)
+        for e in list(self._flowing):
+            if sip.isdeleted(e):
+                del self._flowing[e]
+                continue
+            if e.scene() is not self:
+                # deleted while animating
+                del self._flowing[e]; e.set_flow_active(False)
+                continue
+            e.flow_ttl -= 1
+            if e.flow_ttl <= 0:
+                del self._flowing[e]
+                e.set_flow_active(False)
+            else:
+                e.update()
+        if not self._flowing:
+            self._timer.stop()
 
     def set_node_active(self, nid: str, flag: bool):
         node = self.nodes.get(nid)
         if node: node.setActive(flag)
 
     def mark_exec_edge(self, src_id: str, src_port: str, dst_id: str, dst_port: str):
-        for e in self.edges:
-            if e.kind != "exec": continue
-            if (e.src_port.parent_node.node_id == src_id and e.src_port.name == src_port and e.dst_port.parent_node.node_id == dst_id and e.dst_port.name == dst_port):
-                e.start_flow()
+        e = self.exec_edge_index.get((src_id, src_port, dst_id, dst_port))
+        if e is not None: e.start_flow()
+
+    @staticmethod
+    def _edge_key(e: EdgeItem) -> Tuple[str, str, str, str]:
+        return (e.src_port.parent_node.node_id, e.src_port.name, e.dst_port.parent_node.node_id, e.dst_port.name)
 
     def add_node(self, type_name: str, pos: QtCore.QPointF, params: dict=None) -> NodeItem:
         nid = _new_id()
@@ -572,6 +795,7 @@ class GraphScene(QtWidgets.QGraphicsScene):
         x = round(top_left.x() / GRID_SIZE) * GRID_SIZE
         y = round(top_left.y() / GRID_SIZE) * GRID_SIZE
         item.setPos(QtCore.QPointF(x, y))
+        item.set_detail(self.detail_level)
         self.nodes[nid] = item
         return item
 
@@ -613,9 +837,7 @@ class GraphScene(QtWidgets.QGraphicsScene):
         if src.kind != dst.kind: return False
         if dst.is_output or src.is_output is False: return False
         for e in list(dst.edges):
-            self.removeItem(e); dst.remove_edge(e)
-            if e.src_port: e.src_port.remove_edge(e)
-            if e in self.edges: self.edges.remove(e)
+            self.remove_edge(e)
         if src.kind == "data": return is_compatible(src.dtype, dst.dtype)
         return True
 
@@ -636,24 +858,31 @@ class GraphScene(QtWidgets.QGraphicsScene):
 
     def _finalize_edge(self, src_port: PortItem, dst_port: PortItem):
         e = EdgeItem(kind=src_port.kind, src_port=src_port, dst_port=dst_port)
-        self.addItem(e); src_port.add_edge(e); dst_port.add_edge(e); e.update_path(); return e
+        self.addItem(e); src_port.add_edge(e); dst_port.add_edge(e); e.update_path()
+        if e.kind == "exec": self.exec_edge_index[self._edge_key(e)] = e
+        return e
+
+    def remove_edge(self, e: EdgeItem):
+        """Detach an edge from its ports, the edge list and the index, and remove it from the scene."""
+        if e in self.edges: self.edges.remove(e)
+        if e.kind == "exec" and e.dst_port is not None:
+            key = self._edge_key(e)
+            if self.exec_edge_index.get(key) is e: del self.exec_edge_index[key]
+        if e.src_port: e.src_port.remove_edge(e)
+        if e.dst_port: e.dst_port.remove_edge(e)
+        for cp in list(e.control_points): self.removeItem(cp)
+        self.removeItem(e)
 
     def delete_selected(self):
         for item in list(self.selectedItems()):
             if isinstance(item, EdgeItem):
-                if item in self.edges: self.edges.remove(item)
-                if item.src_port: item.src_port.remove_edge(item)
-                if item.dst_port: item.dst_port.remove_edge(item)
-                for cp in list(item.control_points): self.removeItem(cp)
-                self.removeItem(item)
+                # may already be gone with a node deleted earlier in this loop
+                if item.scene() is self: self.remove_edge(item)
             elif isinstance(item, NodeItem):
+                self.inline_editors.close_for(item)
                 for port in list(item.inputs.values()) + list(item.outputs.values()) + list(item.exec_inputs.values()) + list(item.exec_outputs.values()):
                     for e in list(port.edges):
-                        if e in self.edges: self.edges.remove(e)
-                        if e.src_port: e.src_port.remove_edge(e)
-                        if e.dst_port: e.dst_port.remove_edge(e)
-                        for cp in list(e.control_points): self.removeItem(cp)
-                        self.removeItem(e)
+                        self.remove_edge(e)
                 if item.node_id in self.nodes: del self.nodes[item.node_id]
                 self.removeItem(item)
             elif isinstance(item, CommentItem):
@@ -676,12 +905,39 @@ class GraphView(QtWidgets.QGraphicsView):
         self.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
         self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
+        # every item sets its own pen and brush before drawing
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.DontSavePainterState, True)
+        self.detail_level = LOD_FULL
+
+    def _update_detail_level(self):
+        level = detail_level(self.transform().m11())
+        if level == self.detail_level: return
+        self.detail_level = level
+        full = level == LOD_FULL
+        # full detail: antialiasing, and full repaints (proxy widgets leave trails
+        # with partial updates); zoomed out: no antialiasing, and panning scrolls
+        # the viewport and repaints only the exposed strip
+        self.setRenderHint(QtGui.QPainter.Antialiasing, full)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate if full
+                                   else QtWidgets.QGraphicsView.MinimalViewportUpdate)
+        scene = self.scene()
+        if scene is not None: scene.set_detail_level(level)
+
+    def paintEvent(self, event):
+        # paths left dirty by moves since the last frame are rebuilt first
+        # the transform may also change without wheelEvent (fitInView, resetTransform)
+        self._update_detail_level()
+        scene = self.scene()
+        if scene is not None: scene.flush_edge_paths()
+        super().paintEvent(event)
 
     def wheelEvent(self, event):
         self.scale(1.25 if event.angleDelta().y() > 0 else 0.8, 1.25 if event.angleDelta().y() > 0 else 0.8)
+        self._update_detail_level()
 
     def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF):
         super().drawBackground(painter, rect)
+        if self.detail_level >= LOD_OVERVIEW: return  # grid lines would be a few pixels apart
         left = int(rect.left()) - (int(rect.left()) % GRID_SIZE)
         top = int(rect.top()) - (int(rect.top()) % GRID_SIZE)
         lines_light = []; lines_bold = []
@@ -3,6 +3,7 @@ from .graph import GraphScene, GraphView, NodeItem, TYPE_COLORS, CommentItem
 from ..core.registry import registry
 from ..core.engine import ExecutionEngine
 from ..core.engine_async import EngineRunner
+from ..core.plan_cache import PlanCache
 from .variables_panel import VariablesPanel
 # register nodes
 from ..nodes import math as math_nodes  # noqa: F401
@@ -75,7 +76,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         tb = self.addToolBar("Main")
         runAct = tb.addAction("Run"); runAct.triggered.connect(self.run_graph)
+        profAct = tb.addAction("Run + profil"); profAct.triggered.connect(self.run_graph_profiled)
+        profAct.setToolTip("Mesure chaque noeud et exporte une trace Chrome (chrome://tracing, Perfetto)")
         stopAct = tb.addAction("Stop"); stopAct.triggered.connect(self.stop_run)
+        self.asyncAct = tb.addAction("Async"); self.asyncAct.setCheckable(True)
+        self.asyncAct.setToolTip("Exécute les branches en parallèle (asyncio)")
         clearAct = tb.addAction("Clear"); clearAct.triggered.connect(self.clear_graph)
         addCommentAct = tb.addAction("Commentaire"); addCommentAct.triggered.connect(self.add_comment_here)
 
@@ -84,7 +89,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.view.customContextMenuRequested.connect(self._context_menu)
 
         # --- EngineRunner (background execution) ---
-        self.engine_runner = EngineRunner(self)
+        self.engine_runner = EngineRunner(self, plan_cache=self._make_plan_cache())
         self._hooks = MainWindow.Hooks(self)
         self.engine_runner.sigNodeStarted.connect(self._hooks.on_node_start)
         self.engine_runner.sigNodeFinished.connect(self._hooks.on_node_finish)
@@ -92,6 +97,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.engine_runner.sigNodeOutput.connect(self._hooks.on_node_output)
         self.engine_runner.sigRunStarted.connect(lambda: self.log.appendPlainText("--- RUN (async) ---"))
         self.engine_runner.sigRunFinished.connect(self._on_engine_finished)
+        self.engine_runner.sigProfile.connect(self._on_engine_profile)
         self.engine_runner.sigError.connect(lambda msg: self.log.appendPlainText(f"[ERREUR] {msg}"))
 
         self._example_graph()
@@ -154,12 +160,26 @@ class MainWindow(QtWidgets.QMainWindow):
         pos = self.view.mapToScene(self.view.mapFromGlobal(gpos))
         self.scene.add_node(type_name, pos)
 
+    @staticmethod
+    def _make_plan_cache():
+        """Cache des plans compilés dans le dossier de cache utilisateur (None si indisponible)."""
+        base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+        if not base:
+            return None
+        try:
+            return PlanCache(QtCore.QDir(base).filePath("plans"))
+        except OSError:
+            return None
+
     def clear_graph(self):
         self.scene.clear()
         self.scene.nodes.clear()
         self.scene.edges.clear()
+        self.scene.exec_edge_index.clear()
         if hasattr(self.scene, "comments"):
             self.scene.comments.clear()
+        # nouvelles instances (et ressources des noeuds libérées) au prochain run
+        self.engine_runner.discard_warm()
 
     class Hooks:
         def __init__(self, mw: "MainWindow"):
@@ -176,13 +196,23 @@ class MainWindow(QtWidgets.QMainWindow):
                 ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
                 self.mw.log.appendPlainText(f"[{ts}] {out['printed']}")
 
-    def run_graph(self):
+    def run_graph(self, profile=False, trace_path=""):
         nodes, edges = self.scene.build_specs()
         try:
             init_vars = {name: val for name, (t, val) in self.var_defs.items()}
-            self.engine_runner.start(nodes, edges, init_vars)
+            mode = "async" if self.asyncAct.isChecked() else "sync"
+            self.engine_runner.start(nodes, edges, init_vars, mode=mode, profile=profile, trace_path=trace_path)
         except Exception as e:
             self.log.appendPlainText(f"[ERREUR] {e}")
+
+    def run_graph_profiled(self):
+        # sans fichier choisi, seul le résumé est affiché dans le log
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Trace Chrome", "trace.json", "Trace JSON (*.json)")
+        self.run_graph(profile=True, trace_path=path)
+
+    def _on_engine_profile(self, profiler):
+        self.log.appendPlainText("--- PROFIL (ms) par type ---\n" + profiler.format_summary("type"))
+        self.log.appendPlainText("--- PROFIL (ms) par noeud ---\n" + profiler.format_summary("node", limit=10))
     
     def _on_engine_finished(self, results: dict):
         # Affiche les impressions 'Print' à la fin d'un run async
@@ -211,9 +241,7 @@ class MainWindow(QtWidgets.QMainWindow):
             port.dtype = dtype
             port._update_appearance()
         if item.type_name == "GetVariable":
-            ed = item.output_editors.pop('value', None)
-            if ed:
-                item.scene().removeItem(ed)
+            item.remove_output_editor('value')
         if error:
             brush = QtGui.QBrush(QtGui.QColor('#AA0000'), QtCore.Qt.DiagCrossPattern)
             item._missing_var = True
@@ -255,15 +283,7 @@ class MainWindow(QtWidgets.QMainWindow):
             port = item.outputs.get('value') if item.type_name == "GetVariable" else item.inputs.get('value')
             if port:
                 for e in list(port.edges):
-                    other = e.dst_port if e.src_port == port else e.src_port
-                    if other:
-                        other.remove_edge(e)
-                    for cp in list(e.control_points):
-                        self.scene.removeItem(cp)
-                    if e in self.scene.edges:
-                        self.scene.edges.remove(e)
-                    self.scene.removeItem(e)
-                    port.remove_edge(e)
+                    self.scene.remove_edge(e)
 
     def _on_var_init_changed(self, name: str, new_val: str):
         if name not in self.var_defs:
@@ -277,9 +297,7 @@ class MainWindow(QtWidgets.QMainWindow):
         params = {'name': name, 'type': tname, '_port_types': {'value': dtype}, 'subtitle': name}
         item = self.scene.add_node("GetVariable", pos, params=params)
         item.header.setBrush(QtGui.QBrush(TYPE_COLORS[dtype]))
-        ed = item.output_editors.pop('value', None)
-        if ed:
-            self.scene.removeItem(ed)
+        item.remove_output_editor('value')
 
     def _spawn_set_variable(self, name: str, tname: str):
         pos = self.view.mapToScene(self.view.viewport().rect().center())
@@ -0,0 +1 @@
+"""Benchmarks headless du moteur d'exécution (``python -m benchmarks.<nom>``)."""
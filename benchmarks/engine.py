@@ -0,0 +1,152 @@
+"""Débit du moteur sur des graphes synthétiques, en JSON.
+
+Pour chaque forme de ``benchmarks.graphs`` et chaque taille : steps/sec,
+µs par noeud (meilleur de ``--repeat`` runs) et pic mémoire du run
+(tracemalloc, mesuré à part pour ne pas fausser les temps).
+
+    python -m benchmarks.engine [--sizes 100,1000,5000] [--repeat 5]
+                                [--shapes pure_chain,diamond] [--out res.json]
+                                [--baseline benchmarks/baseline_engine.json]
+                                [--tolerance 0.25] [--save-baseline]
+
+Avec ``--baseline``, chaque mesure est comparée à la référence (µs par
+noeud) et le code de retour vaut 1 si l'une d'elles régresse de plus de
+``--tolerance``. La référence n'a de sens que sur la machine qui l'a
+produite : la régénérer avec ``--save-baseline`` après un changement
+d'environnement.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from app.core.engine import ExecutionEngine
+from app import nodes as _nodes  # noqa: F401  (enregistre les types)
+from .graphs import SHAPES
+
+DEFAULT_SIZES = (100, 1000, 5000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline_engine.json")
+# aucune forme n'approche cette borne : on mesure le moteur, pas la garde
+MAX_STEPS = 10 ** 7
+
+
+def _run_once(nodes, edges) -> ExecutionEngine:
+    eng = ExecutionEngine(nodes, edges, vars_init={"x": 1.0}, max_steps=MAX_STEPS)
+    eng.run()
+    return eng
+
+
+def bench_shape(shape: str, size: int, repeat: int) -> Dict[str, Any]:
+    nodes, edges = SHAPES[shape](size)
+    best, steps = float("inf"), 0
+    # comme timeit : pas de collecte cyclique pendant les mesures
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            eng = _run_once(nodes, edges)
+            dt = time.perf_counter() - t0
+            if dt < best:
+                best, steps = dt, eng.steps
+            del eng
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        _run_once(nodes, edges)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "shape": shape,
+        "size": size,
+        "nodes": len(nodes),
+        "edges": len(edges),
+        "steps": steps,
+        "seconds": best,
+        "steps_per_sec": steps / best if best else 0.0,
+        "us_per_node": best * 1e6 / len(nodes),
+        "peak_kib": peak / 1024,
+    }
+
+
+def run_suite(shapes: List[str], sizes: List[int], repeat: int) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": [bench_shape(s, n, repeat) for s in shapes for n in sizes],
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Rapport de ``report`` à ``baseline`` (µs par noeud) pour les mesures communes."""
+    ref = {(r["shape"], r["size"]): r for r in baseline.get("results", [])}
+    rows = []
+    for r in report["results"]:
+        b = ref.get((r["shape"], r["size"]))
+        if b is None or not b["us_per_node"]:
+            continue
+        ratio = r["us_per_node"] / b["us_per_node"]
+        rows.append({"shape": r["shape"], "size": r["size"], "baseline_us": b["us_per_node"],
+                     "us": r["us_per_node"], "ratio": ratio, "regression": ratio > 1.0 + tolerance})
+    return rows
+
+
+def _split(text: Optional[str], cast=str) -> List[Any]:
+    return [cast(x) for x in text.split(",") if x] if text else []
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    ap.add_argument("--shapes", default=",".join(SHAPES))
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--out", help="fichier JSON de sortie (stdout sinon)")
+    ap.add_argument("--baseline", help="référence JSON à comparer")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--save-baseline", action="store_true", help=f"écrit la référence dans {DEFAULT_BASELINE}")
+    args = ap.parse_args(argv)
+
+    shapes = _split(args.shapes)
+    unknown = [s for s in shapes if s not in SHAPES]
+    if unknown:
+        ap.error(f"formes inconnues : {', '.join(unknown)} (disponibles : {', '.join(SHAPES)})")
+    report = run_suite(shapes, _split(args.sizes, int), args.repeat)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            rows = compare(report, json.load(f), args.tolerance)
+        report["comparison"] = rows
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['shape']:<18} {row['size']:>6}  {row['baseline_us']:9.2f} -> {row['us']:9.2f} µs/noeud"
+                  f"  x{row['ratio']:.2f}{flag}", file=sys.stderr)
+        status = int(any(row["regression"] for row in rows))
+
+    text = json.dumps(report, indent=2)
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Steps/sec du moteur avant/après la compilation du plan d'entrées.
+
+``InterpretedEngine`` reproduit l'ancien ``_gather_inputs`` (copie de
+``params()``, appel de ``inputs()`` et sondage de ``data_incoming`` à chaque
+étape) pour servir de référence.
+
+    python -m benchmarks.engine_plan [--steps 9000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from typing import Any, Dict
+
+from app.core.engine import ExecutionEngine, NodeSpec, EdgeSpec, DEFAULT_PREFIX
+from app import nodes as _nodes  # noqa: F401  (enregistre les types)
+
+
+class InterpretedEngine(ExecutionEngine):
+    """Moteur de référence : résolution des entrées par dictionnaires."""
+
+    def _eval_by_id(self, nid: str, cache: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if nid in cache:
+            return cache[nid]
+        if nid in self.exec_nodes:
+            res = self.results.get(nid, {})
+            cache[nid] = res
+            return res
+        node = self.instances[nid]
+        params = node.params()
+        kwargs = {}
+        for in_name in node.inputs().keys():
+            if (nid, in_name) in self.data_incoming:
+                src_id, src_port = self.data_incoming[(nid, in_name)]
+                kwargs[in_name] = self._eval_by_id(src_id, cache).get(src_port, None)
+            else:
+                kwargs[in_name] = params.get(DEFAULT_PREFIX + in_name, None)
+        out = node.process(**kwargs) or {}
+        cache[nid] = out
+        self.results[nid] = out
+        return out
+
+    def _gather_inputs(self, slot: int) -> Dict[str, Any]:
+        nid = self._plans[slot].id
+        node = self.instances[nid]
+        params = node.params()
+        cache: Dict[str, Dict[str, Any]] = {}
+        kwargs = {}
+        for in_name in node.inputs().keys():
+            if (nid, in_name) in self.data_incoming:
+                src_id, src_port = self.data_incoming[(nid, in_name)]
+                kwargs[in_name] = self._eval_by_id(src_id, cache).get(src_port, None)
+            else:
+                kwargs[in_name] = params.get(DEFAULT_PREFIX + in_name, None)
+        return kwargs
+
+
+def build_graph(steps: int):
+    """BeginPlay -> ``steps`` Print, chacun alimenté par Add(Const, Const) -> FloatToString."""
+    nodes = [NodeSpec("begin", "BeginPlay")]
+    edges = []
+    prev = "begin", "out"
+    for i in range(steps - 1):
+        p, a, b, add, conv = (f"p{i}", f"a{i}", f"b{i}", f"add{i}", f"s{i}")
+        nodes += [
+            NodeSpec(p, "Print"),
+            NodeSpec(a, "ConstFloat", {"value": i}),
+            NodeSpec(b, "ConstFloat", {"value": 0.5}),
+            NodeSpec(add, "Add"),
+            NodeSpec(conv, "FloatToString"),
+        ]
+        edges += [
+            EdgeSpec("exec", prev[0], prev[1], p, "in"),
+            EdgeSpec("data", a, "value", add, "a"),
+            EdgeSpec("data", b, "value", add, "b"),
+            EdgeSpec("data", add, "sum", conv, "value"),
+            EdgeSpec("data", conv, "text", p, "text"),
+        ]
+        prev = p, "then"
+    return nodes, edges
+
+
+def measure(engine_cls, steps: int, repeat: int) -> float:
+    """Meilleur débit (steps/sec) sur ``repeat`` exécutions complètes."""
+    best = 0.0
+    for _ in range(repeat):
+        nodes, edges = build_graph(steps)
+        eng = engine_cls(nodes, edges)
+        t0 = time.perf_counter()
+        eng.run()
+        dt = time.perf_counter() - t0
+        best = max(best, eng.steps / dt)
+    return best
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--steps", type=int, default=9000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+    before = measure(InterpretedEngine, args.steps, args.repeat)
+    after = measure(ExecutionEngine, args.steps, args.repeat)
+    print(f"interprété : {before:12.0f} steps/s")
+    print(f"compilé    : {after:12.0f} steps/s  (x{after / before:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
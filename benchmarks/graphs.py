@@ -0,0 +1,123 @@
+"""Générateurs de graphes synthétiques pour les benchmarks.
+
+Chaque générateur prend une taille ``n`` (nombre de noeuds d'exécution ou
+profondeur du graphe pur) et retourne ``(nodes, edges)`` prêts pour
+``ExecutionEngine``. Les chaînes pures partent d'un ``GetVariable`` pour ne
+pas être entièrement repliées à la compilation.
+"""
+from typing import Callable, Dict, List, Tuple
+
+from app.core.engine import NodeSpec, EdgeSpec, DEFAULT_PREFIX
+
+Graph = Tuple[List[NodeSpec], List[EdgeSpec]]
+
+
+def exec_chain(n: int) -> Graph:
+    """BeginPlay -> ``n`` Print en série."""
+    nodes = [NodeSpec("begin", "BeginPlay")]
+    edges = []
+    prev = "begin", "out"
+    for i in range(n):
+        nodes.append(NodeSpec(f"p{i}", "Print"))
+        edges.append(EdgeSpec("exec", prev[0], prev[1], f"p{i}", "in"))
+        prev = f"p{i}", "then"
+    return nodes, edges
+
+
+def exec_fanout(n: int) -> Graph:
+    """BeginPlay dont la sortie ``out`` déclenche ``n`` Print."""
+    nodes = [NodeSpec("begin", "BeginPlay")]
+    edges = []
+    for i in range(n):
+        nodes.append(NodeSpec(f"p{i}", "Print"))
+        edges.append(EdgeSpec("exec", "begin", "out", f"p{i}", "in"))
+    return nodes, edges
+
+
+def _print_value(nodes, edges, src: Tuple[str, str]):
+    """BeginPlay -> Print(FloatToString(src)) : force l'évaluation de ``src``."""
+    nodes += [NodeSpec("begin", "BeginPlay"), NodeSpec("conv", "FloatToString"), NodeSpec("print", "Print")]
+    edges += [
+        EdgeSpec("exec", "begin", "out", "print", "in"),
+        EdgeSpec("data", src[0], src[1], "conv", "value"),
+        EdgeSpec("data", "conv", "text", "print", "text"),
+    ]
+
+
+def pure_chain(n: int) -> Graph:
+    """Chaîne de ``n`` Add/Multiply alternés à partir d'une variable."""
+    nodes = [NodeSpec("x", "GetVariable", {"name": "x", "type": "Float"})]
+    edges = []
+    src = "x", "value"
+    for i in range(n):
+        if i % 2:
+            nodes.append(NodeSpec(f"m{i}", "Multiply", {DEFAULT_PREFIX + "b": 1.0}))
+            edges.append(EdgeSpec("data", src[0], src[1], f"m{i}", "a"))
+            src = f"m{i}", "product"
+        else:
+            nodes.append(NodeSpec(f"a{i}", "Add", {DEFAULT_PREFIX + "b": 1.0}))
+            edges.append(EdgeSpec("data", src[0], src[1], f"a{i}", "a"))
+            src = f"a{i}", "sum"
+    _print_value(nodes, edges, src)
+    return nodes, edges
+
+
+def diamond(n: int) -> Graph:
+    """``n`` losanges empilés : x -> (x + 1, x * 2) -> somme -> losange suivant."""
+    nodes = [NodeSpec("x", "GetVariable", {"name": "x", "type": "Float"})]
+    edges = []
+    src = "x", "value"
+    for i in range(n):
+        l, r, j = f"l{i}", f"r{i}", f"j{i}"
+        nodes += [
+            NodeSpec(l, "Add", {DEFAULT_PREFIX + "b": 1.0}),
+            NodeSpec(r, "Multiply", {DEFAULT_PREFIX + "b": 2.0}),
+            NodeSpec(j, "Add"),
+        ]
+        edges += [
+            EdgeSpec("data", src[0], src[1], l, "a"),
+            EdgeSpec("data", src[0], src[1], r, "a"),
+            EdgeSpec("data", l, "sum", j, "a"),
+            EdgeSpec("data", r, "product", j, "b"),
+        ]
+        # la somme croît vite : on la ramène à l'échelle de x
+        nodes.append(NodeSpec(f"k{i}", "Multiply", {DEFAULT_PREFIX + "b": 1e-3}))
+        edges.append(EdgeSpec("data", j, "sum", f"k{i}", "a"))
+        src = f"k{i}", "product"
+    _print_value(nodes, edges, src)
+    return nodes, edges
+
+
+def variable_traffic(n: int) -> Graph:
+    """``n`` couples SetVariable(x = x + 1) -> Print(x) : invalide le cache à chaque pas."""
+    nodes = [
+        NodeSpec("begin", "BeginPlay"),
+        NodeSpec("x", "GetVariable", {"name": "x", "type": "Float"}),
+        NodeSpec("inc", "Add", {DEFAULT_PREFIX + "b": 1.0}),
+        NodeSpec("conv", "FloatToString"),
+    ]
+    edges = [
+        EdgeSpec("data", "x", "value", "inc", "a"),
+        EdgeSpec("data", "x", "value", "conv", "value"),
+    ]
+    prev = "begin", "out"
+    for i in range(n):
+        s, p = f"s{i}", f"p{i}"
+        nodes += [NodeSpec(s, "SetVariable", {"name": "x", "type": "Float"}), NodeSpec(p, "Print")]
+        edges += [
+            EdgeSpec("exec", prev[0], prev[1], s, "in"),
+            EdgeSpec("data", "inc", "sum", s, "value"),
+            EdgeSpec("exec", s, "then", p, "in"),
+            EdgeSpec("data", "conv", "text", p, "text"),
+        ]
+        prev = p, "then"
+    return nodes, edges
+
+
+SHAPES: Dict[str, Callable[[int], Graph]] = {
+    "exec_chain": exec_chain,
+    "exec_fanout": exec_fanout,
+    "pure_chain": pure_chain,
+    "diamond": diamond,
+    "variable_traffic": variable_traffic,
+}
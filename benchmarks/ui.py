@@ -0,0 +1,192 @@
+"""Temps des opérations de l'éditeur (GraphScene/GraphView) en JSON.
+
+S'exécute sous la plateforme Qt ``offscreen`` (aucun affichage requis).
+Pour chaque taille N : ``add_node`` ×N, câblage d'environ N arêtes,
+glisser d'une sélection de 500 noeuds, ``delete_selected``, zoom par
+``wheelEvent``, repeints complets de la vue et défilement (vue entière).
+
+    python -m benchmarks.ui [--sizes 100,500,1000] [--frames 30] [--out res.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from app import nodes as _nodes  # noqa: E402,F401  (enregistre les types)
+from app.ui.graph import GraphScene, GraphView, NODE_W, NODE_H  # noqa: E402
+
+DEFAULT_SIZES = (100, 500, 1000)
+DRAG_SELECTION = 500
+VIEW_SIZE = (1280, 800)
+# un motif Add -> FloatToString -> Print, les Print chaînés en exécution
+PATTERN = ("Add", "FloatToString", "Print")
+
+
+class _Bench:
+    """Une scène et sa vue affichée hors écran pour une taille donnée."""
+
+    def __init__(self, app: QtWidgets.QApplication):
+        self.app = app
+        self.scene = GraphScene()
+        self.view = GraphView(self.scene)
+        self.view.resize(*VIEW_SIZE)
+        self.view.show()
+        self.flush()
+
+    def flush(self):
+        """Traite les événements en attente (dont les repeints)."""
+        self.app.processEvents()
+
+    def close(self):
+        self.scene._timer.stop()
+        self.view.close()
+        self.view.deleteLater(); self.scene.deleteLater()
+        self.flush()
+
+    def add_nodes(self, n: int) -> List[Any]:
+        cols = max(1, int(n ** 0.5))
+        items = []
+        for i in range(n):
+            pos = QtCore.QPointF((i % cols) * (NODE_W + 60), (i // cols) * (NODE_H + 60))
+            items.append(self.scene.add_node(PATTERN[i % len(PATTERN)], pos))
+        return items
+
+    def wire(self, items) -> int:
+        """Câble les motifs comme le ferait un glisser de port (remplacement compris)."""
+        scene = self.scene
+        count = 0
+        prev_print = None
+
+        def link(src, dst):
+            nonlocal count
+            if scene._is_link_allowed(src, dst):
+                e = scene._finalize_edge(src, dst)
+                if e:
+                    scene.edges.append(e); count += 1
+
+        for i in range(0, len(items) - len(PATTERN) + 1, len(PATTERN)):
+            add, conv, prt = items[i:i + len(PATTERN)]
+            link(add.outputs["sum"], conv.inputs["value"])
+            link(conv.outputs["text"], prt.inputs["text"])
+            if prev_print is not None:
+                link(prev_print.exec_outputs["then"], prt.exec_inputs["in"])
+            prev_print = prt
+        return count
+
+    def drag(self, items, frames: int):
+        """Déplace la sélection par petits pas, un repeint par pas (comme un glisser souris)."""
+        self.scene.clearSelection()
+        for it in items:
+            it.setSelected(True)
+        for k in range(frames):
+            d = 12 if k % 2 == 0 else -12
+            for it in self.scene.selectedItems():
+                it.moveBy(d, d / 2)
+            self.flush()
+
+    def zoom(self, frames: int):
+        center = QtCore.QPointF(VIEW_SIZE[0] / 2, VIEW_SIZE[1] / 2)
+        for k in range(frames):
+            delta = 120 if (k // 4) % 2 == 0 else -120
+            ev = QtGui.QWheelEvent(center, self.view.mapToGlobal(center.toPoint()), QtCore.QPoint(0, 0),
+                                   QtCore.QPoint(0, delta), QtCore.Qt.NoButton, QtCore.Qt.NoModifier,
+                                   QtCore.Qt.NoScrollPhase, False)
+            self.view.wheelEvent(ev)
+            self.flush()
+
+    def pan(self, frames: int):
+        """Défile la vue par les barres de défilement, un repeint par pas."""
+        bar = self.view.horizontalScrollBar()
+        for k in range(frames):
+            bar.setValue(bar.value() + (40 if (k // 8) % 2 == 0 else -40))
+            self.view.viewport().repaint()
+
+    def repaint(self, frames: int):
+        vp = self.view.viewport()
+        for _ in range(frames):
+            vp.repaint()
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    res = fn(*args)
+    return time.perf_counter() - t0, res
+
+
+def bench_size(app, n: int, frames: int) -> List[Dict[str, Any]]:
+    b = _Bench(app)
+    rows = []
+
+    def row(op, count, dt):
+        rows.append({"op": op, "size": n, "count": count, "seconds": dt,
+                     "ms_per_op": dt * 1e3 / count if count else 0.0})
+
+    try:
+        dt, items = _timed(b.add_nodes, n)
+        row("add_node", n, dt)
+        dt, edges = _timed(b.wire, items)
+        row("wire_edges", edges, dt)
+        # vue entière : tous les noeuds visibles pendant le repeint
+        b.view.fitInView(b.scene.itemsBoundingRect(), QtCore.Qt.KeepAspectRatio)
+        b.flush()
+        dt, _ = _timed(b.repaint, frames)
+        row("repaint_fit", frames, dt)
+        dt, _ = _timed(b.pan, frames)
+        row("pan_fit", frames, dt)
+        b.view.resetTransform(); b.flush()
+        dt, _ = _timed(b.repaint, frames)
+        row("repaint_1x", frames, dt)
+        dt, _ = _timed(b.zoom, frames)
+        row("wheel_zoom", frames, dt)
+        dt, _ = _timed(b.drag, items[:DRAG_SELECTION], frames)
+        row(f"drag_{min(n, DRAG_SELECTION)}", frames, dt)
+        b.scene.clearSelection()
+        for it in items:
+            it.setSelected(True)
+        dt, _ = _timed(b.scene.delete_selected)
+        b.flush()
+        row("delete_selected", n, dt)
+    finally:
+        b.close()
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    ap.add_argument("--frames", type=int, default=30, help="images par mesure de repeint/zoom/glisser")
+    ap.add_argument("--out", help="fichier JSON de sortie (stdout sinon)")
+    args = ap.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    results = []
+    for n in (int(x) for x in args.sizes.split(",") if x):
+        results += bench_size(app, n, args.frames)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "platform": app.platformName(),
+            "view": list(VIEW_SIZE),
+            "frames": args.frames,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from app import nodes  # noqa: F401  (enregistre les types)
+from app.core.engine import ExecutionEngine, NodeSpec, EdgeSpec
+
+
+def _engine():
+    # m.b est câblée à une constante (repliée), m.a à une variable
+    nodes = [NodeSpec("c", "ConstFloat", {"value": 2.0}),
+             NodeSpec("g", "GetVariable", {"name": "x", "type": "Float"}),
+             NodeSpec("m", "Multiply")]
+    edges = [EdgeSpec("data", "c", "value", "m", "b"), EdgeSpec("data", "g", "value", "m", "a")]
+    return ExecutionEngine(nodes, edges, vars_init={"x": 3.0})
+
+
+def test_column_on_input_wired_to_folded_constant_is_rejected():
+    with pytest.raises(ValueError, match="m.b est câblée"):
+        _engine().evaluate_batch({("m", "b"): [10.0, 20.0]})
+
+
+def test_column_on_wired_input_is_rejected():
+    with pytest.raises(ValueError, match="m.a est câblée"):
+        _engine().evaluate_batch({("m", "a"): [10.0, 20.0]})